@@ -0,0 +1,177 @@
+"""Compare BeautifulSoup parser backends on saved product pages.
+
+Pages live in benchmarks/pages/<shop>/<n>.html, with index.json mapping each
+file to the URL it came from. Save a fresh sample per shop (needs the
+database and a Playwright browser), then run the benchmark:
+
+    python benchmarks/bench_parsers.py --save 5
+    python benchmarks/bench_parsers.py [--shops Zooplus Bitiba] [--repeat 5] [--transform]
+    python benchmarks/bench_parsers.py --compare [--shops Zooplus Bitiba]
+
+--transform also times each shop's transform() on the parsed tree.
+--compare checks that each backend gives the same transform() output as
+html.parser, page by page, and exits non-zero on any difference; a shop
+should only set HTML_PARSER once it passes. Some shops call review or
+pricing APIs from transform(), so both modes make network requests.
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import statistics
+import importlib.util
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "libs"))
+
+from loguru import logger
+from sqlalchemy import text
+from pet_scraper.factory import SHOPS, run_etl
+from pet_scraper.parsing import PARSER_BACKENDS, make_soup
+from pet_scraper.fingerprint import fingerprint_frame
+
+PAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pages")
+
+
+async def save_pages(shop: str, n: int) -> None:
+    from pet_scraper.browser_pool import close_browser_pool, get_browser_pool
+    from pet_scraper.politeness import get_scheduler
+
+    client = run_etl(shop)
+    client.declare_rate_budget()
+    rows = client.connection.extract_from_sql(
+        text("SELECT url FROM urls WHERE shop=:shop AND scrape_status='DONE' ORDER BY RAND() LIMIT :n"),
+        {"shop": shop, "n": n})
+
+    shop_dir = os.path.join(PAGES_DIR, shop)
+    os.makedirs(shop_dir, exist_ok=True)
+    index = {}
+
+    try:
+        for i, url in enumerate(rows["url"]):
+            await get_scheduler().acquire(url)
+            async with get_browser_pool().page() as page:
+                await page.goto(url, wait_until="load")
+                html = await page.content()
+
+            file_name = f"{i}.html"
+            with open(os.path.join(shop_dir, file_name), "w", encoding="utf-8") as f:
+                f.write(html)
+            index[file_name] = url
+    finally:
+        await close_browser_pool()
+
+    with open(os.path.join(shop_dir, "index.json"), "w") as f:
+        json.dump(index, f, indent=2)
+
+    logger.info(f"Saved {len(index)} page(s) for {shop}")
+
+
+def load_pages(shop: str):
+    shop_dir = os.path.join(PAGES_DIR, shop)
+    index_path = os.path.join(shop_dir, "index.json")
+    if not os.path.exists(index_path):
+        return []
+
+    with open(index_path) as f:
+        index = json.load(f)
+
+    pages = []
+    for file_name, url in index.items():
+        with open(os.path.join(shop_dir, file_name), encoding="utf-8") as f:
+            pages.append((url, f.read()))
+
+    return pages
+
+
+def time_parser(shop: str, pages, parser: str, repeat: int, transform: bool):
+    """Return median ms per page for parsing (and optionally transforming)"""
+    client = run_etl(shop) if transform else None
+    samples = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for url, html in pages:
+            soup = make_soup(html, parser)
+            if client:
+                client.transform(soup, url)
+        samples.append((time.perf_counter() - start) * 1000 / len(pages))
+
+    return statistics.median(samples)
+
+
+def transform_fingerprint(client, html: str, url: str, parser: str):
+    df = client.transform(make_soup(html, parser), url)
+    return None if df is None else fingerprint_frame(df)
+
+
+def compare_outputs(shop: str, pages, backends) -> bool:
+    """Print, per backend, the pages whose transform() output differs from html.parser's"""
+    client = run_etl(shop)
+    same = True
+
+    for url, html in pages:
+        expected = transform_fingerprint(client, html, url, "html.parser")
+        for backend in backends:
+            if backend == "html.parser":
+                continue
+            if transform_fingerprint(client, html, url, backend) != expected:
+                print(f"{shop:<20}{backend:<12}differs: {url}")
+                same = False
+
+    if same:
+        print(f"{shop:<20}{len(pages)} page(s) identical across {', '.join(backends)}")
+    return same
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--shops", nargs="+", default=list(SHOPS))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--transform", action="store_true")
+    parser.add_argument("--compare", action="store_true",
+                        help="Check transform() output matches html.parser instead of timing.")
+    parser.add_argument("--save", type=int, metavar="N",
+                        help="Save N product pages per shop instead of benchmarking.")
+    args = parser.parse_args()
+
+    if args.save:
+        for shop in args.shops:
+            asyncio.run(save_pages(shop, args.save))
+        return
+
+    if not args.transform:
+        logger.remove()
+
+    backends = [b for b in PARSER_BACKENDS
+                if b == "html.parser" or importlib.util.find_spec(b)]
+
+    if args.compare:
+        results = [compare_outputs(shop, pages, backends)
+                   for shop in args.shops if (pages := load_pages(shop))]
+        sys.exit(0 if all(results) else 1)
+
+    print(f"{'Shop':<20}{'Pages':>6}" + "".join(f"{b + ' ms':>16}" for b in backends) + f"{'Speedup':>10}")
+    totals = {b: 0.0 for b in backends}
+
+    for shop in args.shops:
+        pages = load_pages(shop)
+        if not pages:
+            print(f"{shop:<20}{'-':>6}  no saved pages")
+            continue
+
+        results = {b: time_parser(shop, pages, b, args.repeat, args.transform) for b in backends}
+        for b, ms in results.items():
+            totals[b] += ms * len(pages)
+
+        fastest = min(results.values())
+        print(f"{shop:<20}{len(pages):>6}" + "".join(f"{ms:>16.2f}" for ms in results.values())
+              + f"{results['html.parser'] / fastest:>9.1f}x")
+
+    if totals["html.parser"]:
+        print(f"{'Total (ms)':<26}" + "".join(f"{totals[b]:>16.1f}" for b in backends))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Measure how long a job takes to get from interpreter start to a ready ETL.
+
+Each sample runs in a fresh interpreter so module caches do not skew the
+numbers. Usage:
+
+    python benchmarks/bench_startup.py [--shop Zooplus] [--runs 10]
+"""
+import os
+import sys
+import argparse
+import statistics
+import subprocess
+
+LIBS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "libs")
+
+SNIPPET = """
+import time
+start = time.perf_counter()
+import pet_scraper.factory as factory
+imported = time.perf_counter()
+factory.run_etl({shop!r})
+ready = time.perf_counter()
+print(imported - start, ready - start)
+"""
+
+
+def sample(shop: str):
+    env = dict(os.environ, PYTHONPATH=LIBS_DIR)
+    output = subprocess.run(
+        [sys.executable, "-c", SNIPPET.format(shop=shop)],
+        env=env, capture_output=True, text=True, check=True
+    ).stdout.split()
+    return float(output[-2]), float(output[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--shop", default="Zooplus")
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    sample(args.shop)  # warm the filesystem and bytecode caches
+    samples = [sample(args.shop) for _ in range(args.runs)]
+
+    for label, values in (("import factory", [s[0] for s in samples]),
+                          (f"run_etl({args.shop})", [s[1] for s in samples])):
+        print(f"{label:<24} median {statistics.median(values) * 1000:8.1f} ms"
+              f"   min {min(values) * 1000:8.1f} ms   max {max(values) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+import sys
+sys.path.append("/home/josh/airflow/libs")
+
+import argparse
+import datetime as dt
+from loguru import logger
+from pet_scraper.factory import SHOPS
+from pet_scraper.orchestrator import STAGES, run_shops, log_summary
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Run link discovery and/or product scraping for many shops in one process.")
+    parser.add_argument("--shops", nargs="+", default=list(SHOPS),
+                        help="Shops to run (default: all).")
+    parser.add_argument("--stages", nargs="+", default=list(STAGES), choices=list(STAGES),
+                        help="Stages to run per shop, in order (default: links products).")
+    parser.add_argument("--max-shops", type=int, default=4,
+                        help="Global cap on shops running at the same time.")
+    parser.add_argument("--max-concurrent", type=int, default=None,
+                        help="Per-shop cap on in-flight product pages (default: each shop's MAX_CONCURRENT_PRODUCT_INFO).")
+    return parser.parse_args()
+
+
+if __name__=="__main__":
+    args = parse_args()
+
+    start_time = dt.datetime.now()
+    logger.remove()
+    logger.add("logs/std_out.log", rotation="10 MB", level="INFO")
+    logger.add("logs/std_err.log", rotation="10 MB", level="ERROR")
+    logger.add(sys.stdout, level="INFO")
+    logger.add(sys.stderr, level="ERROR")
+
+    logger.info(f"Multi-shop scraper has started (shops={len(args.shops)}, stages={args.stages})")
+    reports = run_shops(args.shops, args.stages, max_shops=args.max_shops, max_concurrent=args.max_concurrent)
+    log_summary(reports)
+
+    end_time = dt.datetime.now()
+    duration = end_time - start_time
+    logger.info(f"Multi-shop scraper has ended. Elapsed: {duration}")
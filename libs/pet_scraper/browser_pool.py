@@ -0,0 +1,168 @@
+import os
+import asyncio
+import weakref
+
+from contextlib import asynccontextmanager
+from typing import Optional, List
+from playwright.async_api import async_playwright, Playwright, Browser, BrowserContext, Page
+from fake_useragent import UserAgent
+from loguru import logger
+
+BROWSER_POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", "4"))
+MAX_PAGES_PER_CONTEXT = int(os.getenv("BROWSER_MAX_PAGES_PER_CONTEXT", "50"))
+
+BROWSER_ARGS = {
+    "headless": True,
+    "args": [
+        "--disable-blink-features=AutomationControlled",
+        "--disable-web-security",
+        "--disable-features=VizDisplayCompositor",
+        "--no-sandbox",
+        "--disable-dev-shm-usage"
+    ]
+}
+
+
+class _PooledContext:
+    def __init__(self, context: BrowserContext):
+        self.context = context
+        self.pages_served = 0
+        self.crashed = False
+        context.on("close", lambda _: self.mark_crashed())
+
+    def mark_crashed(self) -> None:
+        self.crashed = True
+
+
+class BrowserPool:
+    """Long-lived Chromium instance handing out a bounded set of reusable contexts"""
+
+    def __init__(self, size: int = None, max_pages_per_context: int = None):
+        self.size = size or BROWSER_POOL_SIZE
+        self.max_pages_per_context = max_pages_per_context or MAX_PAGES_PER_CONTEXT
+        self.ua = UserAgent()
+        self.metrics = {
+            "browser_launches": 0,
+            "context_launches": 0,
+            "reuses": 0,
+            "recycles": 0,
+        }
+
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._idle: List[_PooledContext] = []
+        self._semaphore = asyncio.Semaphore(self.size)
+        self._lock = asyncio.Lock()
+
+    async def _get_browser(self) -> Browser:
+        async with self._lock:
+            if self._browser is not None and self._browser.is_connected():
+                return self._browser
+
+            if self._browser is not None:
+                logger.warning("Browser disconnected, relaunching...")
+                self.metrics["recycles"] += len(self._idle)
+                self._idle.clear()
+
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+
+            self._browser = await self._playwright.chromium.launch(**BROWSER_ARGS)
+            self.metrics["browser_launches"] += 1
+            logger.info("Launched pooled Chromium browser")
+
+            return self._browser
+
+    async def _acquire(self) -> _PooledContext:
+        browser = await self._get_browser()
+
+        while self._idle:
+            slot = self._idle.pop()
+            if not slot.crashed:
+                self.metrics["reuses"] += 1
+                return slot
+
+        context_options = {
+            "locale": "en-US",
+            "user_agent": self.ua.random,
+            "viewport": {"width": 1920, "height": 1080}
+        }
+        context = await browser.new_context(**context_options)
+        self.metrics["context_launches"] += 1
+
+        return _PooledContext(context)
+
+    async def _release(self, slot: _PooledContext) -> None:
+        browser_ok = self._browser is not None and self._browser.is_connected()
+
+        if browser_ok and not slot.crashed and slot.pages_served < self.max_pages_per_context:
+            self._idle.append(slot)
+            return
+
+        self.metrics["recycles"] += 1
+        try:
+            await slot.context.close()
+        except Exception as e:
+            logger.warning(f"Error closing recycled context: {e}")
+
+    @asynccontextmanager
+    async def page(self):
+        """Yield a fresh page from a pooled context, closing it afterwards"""
+        async with self._semaphore:
+            slot = await self._acquire()
+            page: Optional[Page] = None
+            try:
+                page = await slot.context.new_page()
+                page.on("crash", lambda _: slot.mark_crashed())
+                slot.pages_served += 1
+                yield page
+
+            finally:
+                if page:
+                    try:
+                        await page.close()
+                    except Exception as e:
+                        logger.error(f"Error closing page: {e}")
+                await self._release(slot)
+
+    def log_metrics(self) -> None:
+        logger.info(
+            "Browser pool metrics: " + ", ".join(f"{k}={v}" for k, v in self.metrics.items()))
+
+    async def close(self) -> None:
+        """Clean up browser resources"""
+        try:
+            for slot in self._idle:
+                await slot.context.close()
+            if self._browser:
+                await self._browser.close()
+            if self._playwright:
+                await self._playwright.stop()
+        except Exception as e:
+            logger.error(f"Error closing browser pool: {e}")
+        finally:
+            self._idle.clear()
+            self._browser = None
+            self._playwright = None
+            self.log_metrics()
+
+
+# Playwright objects are bound to the event loop that created them, so keep
+# one pool per loop.
+_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, BrowserPool]" = weakref.WeakKeyDictionary()
+
+
+def get_browser_pool() -> BrowserPool:
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None:
+        pool = BrowserPool()
+        _pools[loop] = pool
+
+    return pool
+
+
+async def close_browser_pool() -> None:
+    pool = _pools.pop(asyncio.get_running_loop(), None)
+    if pool:
+        await pool.close()
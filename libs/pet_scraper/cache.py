@@ -0,0 +1,248 @@
+import os
+import re
+import json
+import time
+import zlib
+import sqlite3
+import hashlib
+import threading
+
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+from loguru import logger
+
+CACHE_DIR = os.path.expanduser(
+    os.getenv("PET_SCRAPER_CACHE_DIR", "~/.cache/pet_scraper"))
+HTTP_CACHE_ENABLED = os.getenv("HTTP_CACHE_ENABLED", "1") == "1"
+# Lifetime for responses without Cache-Control/Expires. 0 means "store, but
+# revalidate every time", which still turns unchanged pages into a 304.
+HTTP_CACHE_DEFAULT_MAX_AGE = float(os.getenv("HTTP_CACHE_DEFAULT_MAX_AGE", "0"))
+# Bounds on the response store: entries not stored or revalidated for this
+# many days are dropped, then the oldest beyond the row limit.
+HTTP_CACHE_RETENTION_DAYS = float(os.getenv("HTTP_CACHE_RETENTION_DAYS", "14"))
+HTTP_CACHE_MAX_ENTRIES = int(os.getenv("HTTP_CACHE_MAX_ENTRIES", "50000"))
+# Stores between two prunes, on top of the one when the cache is opened.
+HTTP_CACHE_PRUNE_EVERY = 1000
+
+# Headers that describe the transfer rather than the content; the cached
+# body is stored decoded, so replaying these would be wrong.
+HOP_BY_HOP_HEADERS = {
+    "connection", "keep-alive", "transfer-encoding", "content-encoding",
+    "content-length", "set-cookie", "alt-svc", "date", "age",
+}
+
+
+class DiskCache:
+    """Small sqlite key/value store with per-entry timestamps.
+
+    Safe to share between threads and between processes (the parse workers
+    open their own connections to the same file).
+    """
+
+    SCHEMA = "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value TEXT, stored_at REAL)"
+
+    def __init__(self, name: str, path: Optional[str] = None):
+        self.path = path or os.path.join(CACHE_DIR, f"{name}.sqlite")
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._local = threading.local()
+
+        with self._connect() as conn:
+            conn.execute(self.SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str, max_age: Optional[float] = None) -> Optional[Any]:
+        """Return the value for key, or None when missing or older than max_age seconds"""
+        row = self._connect().execute(
+            "SELECT value, stored_at FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        if max_age is not None and time.time() - row[1] > max_age:
+            return None
+        return json.loads(row[0])
+
+    def set_many(self, items: Dict[str, Any]) -> None:
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO entries (key, value, stored_at) VALUES (?, ?, ?)",
+                    [(key, json.dumps(value), now) for key, value in items.items()])
+        except sqlite3.Error as e:
+            # A cache write failing must never fail the scrape.
+            logger.warning(f"Could not write to cache {self.path}: {e}")
+
+    def set(self, key: str, value: Any) -> None:
+        self.set_many({key: value})
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        try:
+            with self._connect() as conn:
+                conn.executemany("DELETE FROM entries WHERE key = ?", [(key,) for key in keys])
+        except sqlite3.Error as e:
+            logger.warning(f"Could not delete from cache {self.path}: {e}")
+
+    def stale_keys(self, prefix: str, max_age: float) -> List[str]:
+        """Keys starting with prefix that were stored more than max_age seconds ago"""
+        rows = self._connect().execute(
+            "SELECT key FROM entries WHERE substr(key, 1, ?) = ? AND stored_at < ?",
+            (len(prefix), prefix, time.time() - max_age)).fetchall()
+        return [row[0] for row in rows]
+
+
+def freshness_lifetime(headers: Mapping[str, str]) -> Optional[float]:
+    """Seconds a response may be served without revalidation; None if it must not be stored"""
+    headers = {k.lower(): v for k, v in headers.items()}
+    cache_control = headers.get("cache-control", "").lower()
+
+    if "no-store" in cache_control:
+        return None
+    if "no-cache" in cache_control:
+        return 0.0
+
+    match = re.search(r"max-age=(\d+)", cache_control)
+    if match:
+        return float(match.group(1))
+
+    if "expires" in headers:
+        try:
+            return max(0.0, parsedate_to_datetime(headers["expires"]).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return 0.0
+
+    return HTTP_CACHE_DEFAULT_MAX_AGE
+
+
+class CachedResponse:
+    def __init__(self, url: str, status: int, headers: Dict[str, str], body: bytes, expires_at: float):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.expires_at = expires_at
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for revalidating this response"""
+        validators = {}
+        if "etag" in self.headers:
+            validators["If-None-Match"] = self.headers["etag"]
+        if "last-modified" in self.headers:
+            validators["If-Modified-Since"] = self.headers["last-modified"]
+        return validators
+
+
+class ResponseCache(DiskCache):
+    """Compressed HTTP response store keyed by URL and Accept header"""
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, url TEXT, status INTEGER, "
+        "headers TEXT, body BLOB, expires_at REAL, stored_at REAL)"
+    )
+
+    def __init__(self, path: Optional[str] = None):
+        super().__init__("responses", path)
+        self._n_stored = 0
+
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_stored_at ON responses (stored_at)")
+        self.prune()
+
+    @staticmethod
+    def key(url: str, accept: str = "") -> str:
+        # The same URL can serve HTML or JSON depending on Accept (Shopify).
+        return hashlib.sha256(f"{url}\n{accept}".encode("utf-8")).hexdigest()
+
+    def lookup(self, url: str, accept: str = "") -> Optional[CachedResponse]:
+        row = self._connect().execute(
+            "SELECT url, status, headers, body, expires_at FROM responses WHERE key = ?",
+            (self.key(url, accept),)).fetchone()
+        if row is None:
+            return None
+
+        return CachedResponse(row[0], row[1], json.loads(row[2]), zlib.decompress(row[3]), row[4])
+
+    def store(self, url: str, accept: str, status: int, headers: Mapping[str, str], body: bytes) -> None:
+        """Store a 200 response if it can ever be served fresh or revalidated"""
+        lifetime = freshness_lifetime(headers)
+        if status != 200 or lifetime is None:
+            return
+
+        kept = {k.lower(): v for k, v in headers.items()
+                if k.lower() not in HOP_BY_HOP_HEADERS}
+        if lifetime <= 0 and "etag" not in kept and "last-modified" not in kept:
+            # Never fresh and nothing to revalidate with: storing it only
+            # costs a write.
+            return
+
+        self._n_stored += 1
+        if self._n_stored % HTTP_CACHE_PRUNE_EVERY == 0:
+            self.prune()
+
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, url, status, headers, body, expires_at, stored_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (self.key(url, accept), url, status, json.dumps(kept),
+                     zlib.compress(body), now + lifetime, now))
+        except sqlite3.Error as e:
+            logger.warning(f"Could not write to cache {self.path}: {e}")
+
+    def prune(self, retention_days: Optional[float] = None, max_entries: Optional[int] = None) -> int:
+        """Drop entries older than retention_days, then the oldest beyond max_entries"""
+        retention_days = HTTP_CACHE_RETENTION_DAYS if retention_days is None else retention_days
+        max_entries = HTTP_CACHE_MAX_ENTRIES if max_entries is None else max_entries
+        try:
+            with self._connect() as conn:
+                n = conn.execute("DELETE FROM responses WHERE stored_at < ?",
+                                 (time.time() - retention_days * 86400,)).rowcount
+                n += conn.execute(
+                    "DELETE FROM responses WHERE key IN "
+                    "(SELECT key FROM responses ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+                    (max_entries,)).rowcount
+        except sqlite3.Error as e:
+            logger.warning(f"Could not prune cache {self.path}: {e}")
+            return 0
+
+        if n:
+            logger.info(f"Pruned {n} cached response(s) from {self.path}")
+        return n
+
+    def revalidated(self, url: str, accept: str, headers: Mapping[str, str]) -> None:
+        """Extend a cached response's lifetime after a 304"""
+        lifetime = freshness_lifetime(headers)
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "UPDATE responses SET expires_at = ?, stored_at = ? WHERE key = ?",
+                    (time.time() + (lifetime or 0.0), time.time(), self.key(url, accept)))
+        except sqlite3.Error as e:
+            logger.warning(f"Could not write to cache {self.path}: {e}")
+
+
+_response_cache: Optional[ResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Process-wide response cache; None when HTTP_CACHE_ENABLED=0"""
+    global _response_cache
+    if not HTTP_CACHE_ENABLED:
+        return None
+
+    with _response_cache_lock:
+        if _response_cache is None:
+            _response_cache = ResponseCache()
+        return _response_cache
@@ -1,13 +1,103 @@
 import os
+import threading
 import pandas as pd
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Sequence, Tuple, Union
 from sqlalchemy import create_engine, text
 from sqlalchemy.engine import Engine
+from sqlalchemy.sql.elements import TextClause
 from sqlalchemy.exc import SQLAlchemyError
 from dotenv import load_dotenv
 from loguru import logger
 
 load_dotenv()
 
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+SQL_CHUNK_SIZE = int(os.getenv("SQL_CHUNK_SIZE", "500"))
+
+SQL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sql")
+
+_engines: Dict[Tuple[str, str], Engine] = {}
+_engines_lock = threading.Lock()
+
+
+def get_engine(db_type: str, database: str, url: str) -> Engine:
+    """Return the process-wide engine for db_type/database, creating it on first use"""
+    key = (db_type, database)
+    with _engines_lock:
+        engine = _engines.get(key)
+        if engine is not None:
+            return engine
+
+        try:
+            engine = create_engine(
+                url,
+                echo=False,
+                pool_size=DB_POOL_SIZE,
+                max_overflow=DB_MAX_OVERFLOW,
+                pool_timeout=DB_POOL_TIMEOUT,
+                pool_recycle=DB_POOL_RECYCLE,
+                pool_pre_ping=True,
+            )
+        except SQLAlchemyError as e:
+            logger.error(f"SQLAlchemy error: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error: {e}")
+            raise
+
+        _engines[key] = engine
+        logger.info(f"Created {db_type} engine for database {database}")
+
+        return engine
+
+
+def dispose_engines() -> None:
+    with _engines_lock:
+        for engine in _engines.values():
+            engine.dispose()
+        _engines.clear()
+
+
+@lru_cache(maxsize=None)
+def load_sql_templates() -> Dict[str, str]:
+    """Read every file in pet_scraper/sql once, keyed by file name"""
+    templates = {}
+    for file_name in sorted(os.listdir(SQL_DIR)):
+        if file_name.endswith(".sql"):
+            with open(os.path.join(SQL_DIR, file_name), "r") as f:
+                templates[file_name] = f.read()
+
+    logger.info(f"Loaded {len(templates)} SQL template(s) from {SQL_DIR}")
+    return templates
+
+
+@lru_cache(maxsize=None)
+def _compile_statement(file_name: str, identifiers: Tuple[Tuple[str, str], ...]) -> TextClause:
+    return text(get_sql_template(file_name).format(**dict(identifiers)))
+
+
+def get_sql_template(file_name: str) -> str:
+    templates = load_sql_templates()
+    if file_name not in templates:
+        logger.error(f"SQL file not found: {os.path.join(SQL_DIR, file_name)}")
+        raise FileNotFoundError(file_name)
+
+    return templates[file_name]
+
+
+def get_statement(file_name: str, **identifiers: str) -> TextClause:
+    """Return the compiled text() statement for a template.
+
+    Values are bound at execution time (:name placeholders); identifiers such
+    as table_name can't be bound, so they are formatted in once per distinct
+    value and the result is cached.
+    """
+    return _compile_statement(file_name, tuple(sorted(identifiers.items())))
+
 
 class Connection:
     def __init__(self, db_type='mysql', database=None):
@@ -33,56 +123,104 @@ class Connection:
         else:
             raise ValueError("db_type must be either 'mysql' or 'postgres'")
 
-        self.engine = self._create_engine()
-
-    def _create_engine(self) -> Engine:
-        try:
-            engine = create_engine(
-                f"{self.driver}://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}",
-                echo=False
-            )
-
-            return engine
-        except SQLAlchemyError as e:
-            logger.error(f"SQLAlchemy error: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error: {e}")
-            raise
-
-    def execute_query(self, sql: str) -> None:
-        logger.info(f"Running query: {sql}")
+    @property
+    def engine(self) -> Engine:
+        # Engines (and their connection pools) are shared by every Connection
+        # pointing at the same database and only created when first used.
+        return get_engine(
+            self.db_type,
+            self.database,
+            f"{self.driver}://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
+        )
+
+    def execute_query(self, sql: Union[str, TextClause], params: Union[dict, List[dict]] = None) -> None:
+        """Run a statement with bound parameters; a list of dicts is executed as one executemany batch"""
+        if isinstance(params, list):
+            logger.info(f"Running query ({len(params)} parameter sets): {sql}")
+        else:
+            logger.info(f"Running query: {sql}")
         try:
             with self.engine.begin() as conn:
-                conn.execute(text(sql))
+                conn.execute(sql if isinstance(sql, TextClause) else text(sql), params)
 
         except Exception as e:
             logger.error(f"Error executing query: {e}")
             raise
 
     def get_sql_from_file(self, file_name: str) -> str:
-        file_path = os.path.join("sql", file_name)
-        try:
-            with open(file_path, "r") as f:
-                return f.read()
-        except FileNotFoundError:
-            logger.error(f"SQL file not found: {file_path}")
-            raise
+        return get_sql_template(file_name)
+
+    def get_statement(self, file_name: str, **identifiers: str) -> TextClause:
+        return get_statement(file_name, **identifiers)
 
     def update_url_scrape_status(self, pkey: int, status: str, timestamp: str) -> None:
-        sql = self.get_sql_from_file("update_url_scrape_status.sql")
-        formatted_sql = sql.format(
-            status=status, timestamp=timestamp, pkey=pkey)
-        self.execute_query(formatted_sql)
+        self.execute_query(
+            get_statement("update_url_scrape_status.sql"),
+            {"status": status, "timestamp": timestamp, "pkey": pkey})
+
+    def update_url_scrape_statuses(self, rows: list) -> None:
+        """Apply a batch of status updates through a temporary table join"""
+        table_name = "stg_url_status"
+        create_sql = get_statement(
+            "create_temp_table_url_status.sql", table_name=table_name)
+        insert_sql = get_statement(
+            "insert_into_temp_url_status.sql", table_name=table_name)
+        update_sql = get_statement(
+            "update_urls_from_temp_url_status.sql", table_name=table_name)
+        drop_sql = get_statement(
+            "drop_temporary_table.sql", table_name=table_name)
+
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(create_sql)
+                conn.execute(insert_sql, rows)
+                conn.execute(update_sql)
+                conn.execute(drop_sql)
 
-    def extract_from_sql(self, sql: str) -> pd.DataFrame:
+            logger.info(f"Updated scrape status of {len(rows)} URL(s).")
+
+        except Exception as e:
+            logger.error(f"Error updating URL scrape statuses: {e}")
+            raise
+
+    def extract_from_sql(self, sql: Union[str, TextClause], params: dict = None) -> pd.DataFrame:
         try:
-            return pd.read_sql(sql, self.engine)
+            return pd.read_sql(sql, self.engine, params=params)
 
         except Exception as e:
             logger.error(e)
             raise e
 
+    def iter_chunks(self, sql: TextClause, params: dict = None, chunksize: int = SQL_CHUNK_SIZE,
+                    key: Union[str, Sequence[str]] = "id", start: Any = 0) -> Iterator[List[Any]]:
+        """Yield rows of a keyset-paginated query, chunksize rows at a time.
+
+        The statement must filter on key > :last_id, order by key and end with
+        LIMIT :limit. Each chunk is its own short query, so no cursor or
+        connection is held open while the caller works through a chunk.
+
+        For a composite key pass a sequence of columns and matching start
+        values; each is bound as :last_<column>.
+        """
+        keys = (key,) if isinstance(key, str) else tuple(key)
+        last = dict(zip(keys, (start,) if isinstance(key, str) else tuple(start)))
+        while True:
+            try:
+                with self.engine.connect() as conn:
+                    rows = conn.execute(
+                        sql, {**(params or {}), **{f"last_{k}": v for k, v in last.items()},
+                              "limit": chunksize}).all()
+            except Exception as e:
+                logger.error(f"Error reading chunk after {last}: {e}")
+                raise
+
+            if rows:
+                yield rows
+                last = {k: getattr(rows[-1], k) for k in keys}
+
+            if len(rows) < chunksize:
+                return
+
     def df_to_sql(self, data: pd.DataFrame, table_name: str):
         try:
             n = data.shape[0]
@@ -1,15 +1,64 @@
 import os
 import json
+import time
 import asyncio
 import pandas as pd
 
 from abc import ABC, abstractmethod
+from typing import Callable, List, Optional
 from sqlalchemy.engine import Engine
 from .connection import Connection
-from .scraper import scrape_url
+from .writers import BulkLoader, UrlStatusWriter
+from .scraper import RawPage, scrape_url
+from .parsing import PARSE_WORKERS, discard_parse_executor, get_parse_executor, make_soup
+from .http_client import close_async_client, connection_stats, fetch_page, is_fresh
+from .metrics import ShopMetrics, get_metrics
+from .fingerprint import fingerprint_fragment, fingerprint_frame
+from .browser_pool import close_browser_pool
+from .runner import run_threaded
+from .routing import BLOCK_REQUESTS, DEFAULT_BLOCKED_DOMAINS, DEFAULT_BLOCKED_RESOURCE_TYPES, RequestFilter
+from .politeness import get_scheduler, host_of, requests_per_minute_from_sleep
 from loguru import logger
 from datetime import datetime as dt
 from bs4 import BeautifulSoup
+from concurrent.futures.process import BrokenProcessPool
+
+PIPELINE_QUEUE_SIZE = int(os.getenv("PIPELINE_QUEUE_SIZE", "100"))
+# How browser product fetches decide a page is done; "ready" waits for the
+# DOM and READY_SELECTOR only. Set to "load" to compare against the old wait.
+PRODUCT_WAIT_UNTIL = os.getenv("PRODUCT_WAIT_UNTIL", "ready")
+# Recrawl scheduling: DONE products are rescraped once older than the
+# shop's FRESHNESS_HOURS; failed ones are retried after a backoff that
+# doubles with each consecutive failure, capped at FRESHNESS_HOURS.
+RECRAWL_FRESHNESS_HOURS = float(os.getenv("RECRAWL_FRESHNESS_HOURS", "72"))
+FAILED_RETRY_BACKOFF_MINUTES = int(os.getenv("FAILED_RETRY_BACKOFF_MINUTES", "60"))
+SCHEDULE_REASONS = {0: "new", 1: "retry", 2: "stale"}
+# Consecutive complete discovery runs a URL must be missing from before it
+# is marked inactive, so one bad listing page can't retire live products.
+VANISHED_AFTER_RUNS = int(os.getenv("VANISHED_AFTER_RUNS", "3"))
+# Products whose content fingerprint matches the last scrape are marked
+# DONE without being loaded. Set to 0 to force a full reload.
+SKIP_UNCHANGED_PRODUCTS = os.getenv("SKIP_UNCHANGED_PRODUCTS", "1") == "1"
+
+
+class PageNotReady(Exception):
+    """An HTTP-fetched page lacks the shop's ready selector and needs the browser"""
+
+
+class RatingsPending(Exception):
+    """transform() needed Feefo ratings that aren't cached yet"""
+
+    @property
+    def misses(self):
+        return self.args[0]
+
+
+def _transform_page(shop: str, html: bytes, url: str, previous: Optional[str] = None,
+                    ready_selector: Optional[str] = None, defer_ratings: bool = False):
+    """Parse and transform one fetched page inside a parse worker process"""
+    from .factory import run_etl
+
+    return run_etl(shop)._transform_html(html, url, previous, ready_selector, defer_ratings)
 
 
 class PetProductsETL(ABC):
@@ -20,11 +69,128 @@ class PetProductsETL(ABC):
         self.connection = Connection()
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 3
+        self.MAX_CONCURRENT_PRODUCT_INFO = 1
+        # Politeness budgets for BASE_URL's host. None derives the product
+        # rate from the sleep window above and the listing rate from the
+        # default scrape() window (2-5 sec).
+        self.REQUESTS_PER_MINUTE = None
+        self.LISTING_REQUESTS_PER_MINUTE = None
+        self.BURST = 1
+        # Listing pages fetched at once by get_paginated_links; the listing
+        # budget still paces the requests themselves.
+        self.MAX_CONCURRENT_LISTING = 4
+        # Categories extracted at once by get_links_by_category, each on its
+        # own thread, event loop and browser pool.
+        self.MAX_CONCURRENT_CATEGORIES = 2
+        # Run parsing and transform() in the shared parse worker processes.
+        # Shops whose transform() drives the browser or makes its own
+        # requests must keep it on the event loop: the politeness scheduler
+        # is per process, so a worker's requests would bypass the budget.
+        self.PARSE_IN_PROCESS = True
+        # Parser backend for product pages; None uses parsing.HTML_PARSER.
+        # Only switch a shop to "lxml" once bench_parsers.py --compare
+        # shows its transform() output unchanged.
+        self.HTML_PARSER = None
+        # "http" tries the pooled HTTP client first and only falls back to
+        # the browser when SELECTOR_SCRAPE_PRODUCT_INFO isn't in the raw HTML.
+        self.FETCH_STRATEGY = "browser"
+        # FeefoRatings for shops that show Feefo reviews; stale cached
+        # ratings are refreshed in batches before each product run, and
+        # uncached ones are looked up in batches during it.
+        self.FEEFO_RATINGS = None
+        # Requests browser pages may not make. ALLOWED_DOMAINS wins over
+        # both lists, for shops that render content from a third party.
+        self.BLOCKED_RESOURCE_TYPES = DEFAULT_BLOCKED_RESOURCE_TYPES
+        self.BLOCKED_DOMAINS = DEFAULT_BLOCKED_DOMAINS
+        self.ALLOWED_DOMAINS = ()
+        # Human-like scrolling and mouse movement on browser pages:
+        # "none", "light" or "full" (see scraper.BEHAVIOR_PROFILES). Only
+        # shops that actually challenge bots need "full".
+        self.BEHAVIOR_PROFILE = "light"
+        # Selector that marks a product page as ready to parse; None uses
+        # SELECTOR_SCRAPE_PRODUCT_INFO. Shops whose transform() only reads
+        # embedded JSON can point it at that script instead.
+        self.READY_SELECTOR = None
+        self.PRODUCT_WAIT_UNTIL = PRODUCT_WAIT_UNTIL
+        # How old a scraped product may get before it is due again, and the
+        # most product pages one get_product_infos run may fetch (None for
+        # no cap), so slow shops spread the catalogue over several runs.
+        self.FRESHNESS_HOURS = RECRAWL_FRESHNESS_HOURS
+        self.MAX_PAGES_PER_RUN = None
+        # Selector for the part of a product page transform() reads. When
+        # set, an unchanged fragment skips transform() as well as the load;
+        # otherwise the transform() output is fingerprinted. Leave it None
+        # for shops whose transform() also calls review or pricing APIs.
+        self.FINGERPRINT_SELECTOR = None
+
+    @property
+    def metrics(self) -> ShopMetrics:
+        return get_metrics(self.SHOP)
+
+    @property
+    def ready_selector(self) -> str:
+        return self.READY_SELECTOR or self.SELECTOR_SCRAPE_PRODUCT_INFO
+
+    @property
+    def request_filter(self) -> Optional[RequestFilter]:
+        if not BLOCK_REQUESTS:
+            return None
+        return RequestFilter(self.BLOCKED_RESOURCE_TYPES, self.BLOCKED_DOMAINS, self.ALLOWED_DOMAINS)
 
-    async def scrape(self, url, selector, headers=None, wait_until="domcontentloaded", min_sec=2, max_sec=5):
-        soup = await scrape_url(url, selector, headers, wait_until, min_sec=min_sec, max_sec=max_sec)
+    async def scrape(self, url, selector, headers=None, wait_until="domcontentloaded", min_sec=2, max_sec=5, raw=False):
+        soup = await scrape_url(url, selector, headers, wait_until, min_sec=min_sec, max_sec=max_sec, raw=raw,
+                                metrics=self.metrics, request_filter=self.request_filter,
+                                behavior=self.BEHAVIOR_PROFILE)
         return soup if soup else False
 
+    def declare_rate_budget(self, listing: bool = False) -> None:
+        if listing:
+            rpm = self.LISTING_REQUESTS_PER_MINUTE or requests_per_minute_from_sleep(
+                2, 5)
+        else:
+            rpm = self.REQUESTS_PER_MINUTE or requests_per_minute_from_sleep(
+                self.MIN_SEC_SLEEP_PRODUCT_INFO, self.MAX_SEC_SLEEP_PRODUCT_INFO)
+
+        get_scheduler().set_budget(host_of(self.BASE_URL), rpm, self.BURST)
+
+    def get_paginated_links(self, page_url: Callable[[int], str], n_pages: int, selector: str,
+                            extract_links: Callable[[BeautifulSoup], List[str]],
+                            first_page: Optional[BeautifulSoup] = None, **scrape_kwargs) -> List[str]:
+        """Fetch listing pages 1..n_pages concurrently and return their links.
+
+        page_url(n) builds the URL of page n and extract_links pulls the
+        product links out of one page. Pass the page 1 soup the caller
+        already has as first_page so it isn't fetched twice. Links come back
+        deduplicated, in page order.
+        """
+        return asyncio.run(self._get_paginated_links(
+            page_url, n_pages, selector, extract_links, first_page, **scrape_kwargs))
+
+    async def _get_paginated_links(self, page_url, n_pages, selector, extract_links, first_page, **scrape_kwargs):
+        semaphore = asyncio.Semaphore(max(1, self.MAX_CONCURRENT_LISTING))
+
+        async def fetch(n):
+            if n == 1 and first_page:
+                return first_page
+            async with semaphore:
+                return await self.scrape(page_url(n), selector, **scrape_kwargs)
+
+        pages = await asyncio.gather(*(fetch(n) for n in range(1, n_pages + 1)))
+
+        links = []
+        for n, soup in enumerate(pages, start=1):
+            if not soup:
+                self.metrics.incr("listing.page_failed")
+                logger.warning(f"Skipping listing page {n}: failed to scrape {page_url(n)}")
+                continue
+            try:
+                links.extend(extract_links(soup))
+            except Exception as e:
+                logger.error(f"Failed to extract links from {page_url(n)}: {e}")
+
+        self.metrics.incr("listing.pages", n_pages)
+        return list(dict.fromkeys(links))
+
     @abstractmethod
     def extract(self, category):
         pass
@@ -45,34 +211,22 @@ class PetProductsETL(ABC):
             logger.error(e)
             raise e
 
-    def get_product_infos(self):
+    def get_product_infos(self, max_concurrent: Optional[int] = None):
+        """Scrape due product pages; max_concurrent overrides MAX_CONCURRENT_PRODUCT_INFO for this run"""
+        self.declare_rate_budget()
         temp_table = f"stg_{self.SHOP.lower()}_temp_products"
-        create_temp_sql = self.connection.get_sql_from_file(
-            'create_temp_table_product_info.sql')
-        create_temp_sql = create_temp_sql.format(
-            table_name=temp_table)
+        create_temp_sql = self.connection.get_statement(
+            'create_temp_table_product_info.sql', table_name=temp_table)
         self._temp_table(create_temp_sql, temp_table, 'created')
 
-        sql = self.connection.get_sql_from_file('select_unscraped_urls.sql')
-        sql = sql.format(shop=self.SHOP)
-        df_urls = self.connection.extract_from_sql(sql)
+        if self.FEEFO_RATINGS:
+            self.FEEFO_RATINGS.refresh_stale()
 
-        for i, row in df_urls.iterrows():
-            pkey = row["id"]
-            url = row["url"]
-
-            now = dt.now().strftime("%Y-%m-%d %H:%M:%S")
-            soup = asyncio.run(self.scrape(
-                url, self.SELECTOR_SCRAPE_PRODUCT_INFO, min_sec=self.MIN_SEC_SLEEP_PRODUCT_INFO, max_sec=self.MAX_SEC_SLEEP_PRODUCT_INFO, wait_until='load'))
-            df = self.transform(soup, url)
-
-            if df is not None:
-                self.load(df, temp_table)
-                self.connection.update_url_scrape_status(pkey, "DONE", now)
-            else:
-                self.connection.update_url_scrape_status(pkey, "FAILED", now)
-
-            logger.info(f"{i+1} out of {len(df_urls)} URL(s) Scraped")
+        self.metrics.reset()
+        n_done, n_failed, n_unchanged = asyncio.run(
+            self._scrape_product_infos(temp_table, max_concurrent))
+        self.metrics.log()
+        connection_stats.log()
 
         for sql_file, label in [
             ('insert_into_pet_products.sql', 'data product inserted'),
@@ -81,45 +235,405 @@ class PetProductsETL(ABC):
             ('insert_into_pet_product_variant_prices.sql',
              'data product price inserted')
         ]:
-            sql = self.connection.get_sql_from_file(
-                sql_file).format(table_name=temp_table)
+            sql = self.connection.get_statement(
+                sql_file, table_name=temp_table)
             self._temp_table(sql, temp_table, label)
 
-        self._temp_table(f"DROP TABLE {temp_table};", temp_table, 'deleted')
+        drop_sql = self.connection.get_statement(
+            'drop_table.sql', table_name=temp_table)
+        self._temp_table(drop_sql, temp_table, 'deleted')
+
+        return {"done": n_done, "failed": n_failed, "unchanged": n_unchanged}
+
+    async def _iter_urls_to_scrape(self):
+        """Stream (id, url, fingerprint) rows that are due for a scrape, most urgent first.
+
+        Never-scraped URLs come first, then failed ones whose backoff has
+        passed, then DONE ones older than FRESHNESS_HOURS, oldest first. At
+        most MAX_PAGES_PER_RUN rows are yielded.
+        """
+        params = {
+            "shop": self.SHOP,
+            "now": dt.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "backoff_minutes": FAILED_RETRY_BACKOFF_MINUTES,
+            "freshness_minutes": int(self.FRESHNESS_HOURS * 60),
+        }
+        chunks = self.connection.iter_chunks(
+            self.connection.get_statement('select_urls_to_scrape.sql'), params,
+            key=("priority", "due_at", "id"), start=(-1, dt(1970, 1, 1), 0))
+        loop = asyncio.get_running_loop()
+        n_scheduled = 0
+
+        while True:
+            # Keep the event loop free for in-flight fetches while reading.
+            chunk = await loop.run_in_executor(None, next, chunks, None)
+            if chunk is None:
+                return
+            for row in chunk:
+                if self.MAX_PAGES_PER_RUN is not None and n_scheduled >= self.MAX_PAGES_PER_RUN:
+                    logger.info(
+                        f"[{self.SHOP}] Reached MAX_PAGES_PER_RUN ({self.MAX_PAGES_PER_RUN}); the rest waits for the next run")
+                    return
+                n_scheduled += 1
+                self.metrics.incr(f"schedule.{SCHEDULE_REASONS[row.priority]}")
+                yield row.id, row.url, row.content_fingerprint
+
+    async def _fetch_http(self, url: str):
+        """Try the HTTP tier; None means the browser should handle url.
+
+        Whether the page holds ready_selector is only checked once it is
+        parsed (see PageNotReady), so the event loop never parses HTML.
+        """
+        if not self.ready_selector:
+            # Nothing to tell a product page from a bot challenge.
+            self.metrics.incr("http_fallback.no_selector")
+            return None
+
+        # A fresh cached copy costs no request, so it needs no budget either.
+        if not is_fresh(url):
+            await get_scheduler().acquire(url)
+        started = time.perf_counter()
+        page = await fetch_page(url, metrics=self.metrics)
+        self.metrics.observe("latency.http_ms", (time.perf_counter() - started) * 1000)
+
+        if page is None:
+            self.metrics.incr("http_fallback.error")
+            return None
+
+        if page.status in (404, 410):
+            logger.warning(f"Skipping scrape: HTTP {page.status} error for {url}")
+            return False
+
+        if page.status >= 400:
+            self.metrics.incr(f"http_fallback.status_{page.status}")
+            return None
+
+        return page
+
+    async def _scrape_product_info(self, url: str):
+        """Fetch url: (timestamp, page, whether the HTTP tier fetched it)"""
+        now = dt.now().strftime("%Y-%m-%d %H:%M:%S")
+
+        if self.FETCH_STRATEGY == "http":
+            page = await self._fetch_http(url)
+            if page is not None:
+                if not page:
+                    self.metrics.incr("served.none")
+                return now, page, True
+
+        return (*await self._scrape_browser(url), False)
+
+    async def _scrape_browser(self, url: str):
+        now = dt.now().strftime("%Y-%m-%d %H:%M:%S")
+        page = await self.scrape(
+            url, self.ready_selector, min_sec=self.MIN_SEC_SLEEP_PRODUCT_INFO, max_sec=self.MAX_SEC_SLEEP_PRODUCT_INFO, wait_until=self.PRODUCT_WAIT_UNTIL, raw=True)
+        self.metrics.incr("served.browser" if page else "served.none")
+        return now, page
+
+    def _transform_with_fingerprint(self, soup, url: str, previous: Optional[str] = None,
+                                    ready_selector: Optional[str] = None, defer_ratings: bool = False):
+        """transform() soup and fingerprint the result: (df, fingerprint).
+
+        Raises PageNotReady when ready_selector is given and missing, and
+        RatingsPending when defer_ratings is set and transform() asked for
+        Feefo ratings that aren't cached. With FINGERPRINT_SELECTOR set, a
+        fragment matching previous returns (None, previous) without running
+        transform(). A failed transform() returns (None, None).
+        """
+        if soup and ready_selector and soup.select_one(ready_selector) is None:
+            raise PageNotReady(url)
+
+        fingerprint = None
+        if soup and self.FINGERPRINT_SELECTOR:
+            fingerprint = fingerprint_fragment(soup, self.FINGERPRINT_SELECTOR)
+            if SKIP_UNCHANGED_PRODUCTS and fingerprint is not None and fingerprint == previous:
+                return None, fingerprint
+
+        if defer_ratings and self.FEEFO_RATINGS:
+            with self.FEEFO_RATINGS.deferring() as misses:
+                df = self.transform(soup, url)
+            if misses:
+                raise RatingsPending(misses)
+        else:
+            df = self.transform(soup, url)
+
+        if df is None:
+            return None, None
+
+        return df, fingerprint or fingerprint_frame(df)
+
+    def _transform_html(self, html: Optional[bytes], url: str, previous: Optional[str] = None,
+                        ready_selector: Optional[str] = None, defer_ratings: bool = False):
+        soup = make_soup(html, self.HTML_PARSER) if html is not None else False
+        return self._transform_with_fingerprint(soup, url, previous, ready_selector, defer_ratings)
+
+    async def _transform_page(self, page: RawPage, url: str, previous: Optional[str] = None,
+                              ready_selector: Optional[str] = None, defer_ratings: bool = False):
+        html = page.html if page else None
+        loop = asyncio.get_running_loop()
+        executor = get_parse_executor() if self.PARSE_IN_PROCESS else None
+
+        if executor is not None:
+            try:
+                return await loop.run_in_executor(
+                    executor, _transform_page, self.SHOP, html, url, previous, ready_selector, defer_ratings)
+            except BrokenProcessPool as e:
+                logger.error(
+                    f"Parse worker died on {url}, restarting the pool: {e}")
+                discard_parse_executor(executor)
+
+        # In-process transforms may block on the rate limiter or on HTTP
+        # calls of their own, so they run on a worker thread, not the loop.
+        return await loop.run_in_executor(
+            None, self._transform_html, html, url, previous, ready_selector, defer_ratings)
+
+    async def _parse_product_info(self, url: str, previous: Optional[str], now: str, page, via_http: bool):
+        """Transform a fetched page: (timestamp, page, (df, fingerprint)).
+
+        Refetches the page in the browser if HTTP got the wrong page. Feefo
+        ratings missing from the cache aren't fetched one by one here: the
+        result is then a RatingsPending naming them, so the caller can fetch
+        them in a batch and transform the page again.
+        """
+        defer_ratings = self.FEEFO_RATINGS is not None
+
+        async def transform(page, ready_selector=None):
+            try:
+                return await self._transform_page(page, url, previous, ready_selector, defer_ratings)
+            except RatingsPending as e:
+                return e
+
+        if via_http and page:
+            try:
+                result = await transform(page, self.ready_selector)
+                self.metrics.incr("served.http")
+                return now, page, result
+            except PageNotReady:
+                self.metrics.incr("http_fallback.selector_missing")
+
+            now, page = await self._scrape_browser(url)
+
+        return now, page, await transform(page)
+
+    async def _scrape_product_infos(self, temp_table: str, max_concurrent: Optional[int] = None):
+        """Run the product pipeline: read urls -> fetch -> parse -> load.
+
+        Stages are joined by bounded queues, so memory stays flat however big
+        the backlog is. max_concurrent, or else MAX_CONCURRENT_PRODUCT_INFO,
+        sets the number of fetch workers and PARSE_WORKERS the number of
+        parse processes, so fetch concurrency and parse throughput scale
+        separately; a single loader owns the database writes. Products whose fingerprint matches the one
+        stored on urls are marked DONE without reaching the temp table. HTTP
+        pages found to lack ready_selector are refetched in the browser by
+        the parse stage, and pages whose Feefo ratings aren't cached wait
+        until a batch of them can be looked up together.
+        """
+        url_queue: asyncio.Queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        page_queue: asyncio.Queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        row_queue: asyncio.Queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        n_fetchers = max(1, max_concurrent or self.MAX_CONCURRENT_PRODUCT_INFO)
+        executor = get_parse_executor() if self.PARSE_IN_PROCESS else None
+        n_parsers = PARSE_WORKERS if executor is not None else 1
+        counts = {"done": 0, "failed": 0, "unchanged": 0}
+
+        async def read_urls():
+            async for item in self._iter_urls_to_scrape():
+                await url_queue.put(item)
+            for _ in range(n_fetchers):
+                await url_queue.put(None)
+
+        async def fetch():
+            while (item := await url_queue.get()) is not None:
+                pkey, url, previous = item
+                now, page, via_http = await self._scrape_product_info(url)
+                await page_queue.put((pkey, url, previous, now, page, via_http))
+
+        # Pages waiting on Feefo ratings that aren't cached yet.
+        pending = []
+
+        async def transform_pending():
+            batch = pending[:]
+            pending.clear()
+            if not batch:
+                return
+
+            misses = [miss for *_, result in batch for miss in result.misses]
+            self.metrics.incr("feefo.deferred", len(batch))
+            await asyncio.get_running_loop().run_in_executor(
+                None, self.FEEFO_RATINGS.prefetch_deferred, misses)
+
+            for pkey, url, previous, now, page, _ in batch:
+                df, fingerprint = await self._transform_page(page, url, previous)
+                await row_queue.put((pkey, now, previous, df, fingerprint))
+
+        async def parse():
+            while (item := await page_queue.get()) is not None:
+                pkey, url, previous, now, page, via_http = item
+                now, page, result = await self._parse_product_info(
+                    url, previous, now, page, via_http)
+
+                if isinstance(result, RatingsPending):
+                    pending.append((pkey, url, previous, now, page, result))
+                    if len(pending) >= self.FEEFO_RATINGS.batch_size:
+                        await transform_pending()
+                    continue
+
+                df, fingerprint = result
+                await row_queue.put((pkey, now, previous, df, fingerprint))
+
+        async def run_workers(worker, n, queue_out, n_sentinels):
+            await asyncio.gather(*(worker() for _ in range(n)))
+            for _ in range(n_sentinels):
+                await queue_out.put(None)
+
+        async def fetch_all():
+            await run_workers(fetch, n_fetchers, page_queue, n_parsers)
+
+        async def parse_all():
+            await asyncio.gather(*(parse() for _ in range(n_parsers)))
+            await transform_pending()
+            await row_queue.put(None)
+
+        async def load():
+            # Statuses only flush after the buffered rows they describe.
+            with BulkLoader(self.connection, temp_table) as loader, \
+                    UrlStatusWriter(self.connection, before_flush=loader.flush) as status_writer:
+                while (item := await row_queue.get()) is not None:
+                    pkey, now, previous, df, fingerprint = item
+
+                    if SKIP_UNCHANGED_PRODUCTS and fingerprint is not None and fingerprint == previous:
+                        status_writer.add(pkey, "DONE", now)
+                        self.metrics.incr("fingerprint.unchanged")
+                        counts["done"] += 1
+                        counts["unchanged"] += 1
+                    elif df is not None:
+                        loader.add(df)
+                        status_writer.add(pkey, "DONE", now, fingerprint)
+                        self.metrics.incr("fingerprint.changed")
+                        counts["done"] += 1
+                    else:
+                        status_writer.add(pkey, "FAILED", now)
+                        counts["failed"] += 1
+
+                    logger.info(
+                        f"{counts['done'] + counts['failed']} URL(s) Scraped "
+                        f"({counts['failed']} failed, {counts['unchanged']} unchanged)")
+
+        tasks = [asyncio.create_task(stage())
+                 for stage in (read_urls, fetch_all, parse_all, load)]
+        try:
+            # A failing stage would leave the others blocked on a queue, so
+            # stop everything as soon as one of them raises.
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                task.result()
+
+            return counts["done"], counts["failed"], counts["unchanged"]
+
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await close_browser_pool()
+            await close_async_client()
 
     def get_links_by_category(self):
-        self.connection.execute_query(
-            f"DELETE FROM urls WHERE shop = '{self.SHOP}'")
+        self.declare_rate_budget(listing=True)
+        self.metrics.reset()
         temp_table = f"stg_{self.SHOP.lower()}_temp"
-        self.connection.execute_query(f"DROP TABLE IF EXISTS {temp_table};")
+        drop_sql = self.connection.get_statement(
+            'drop_table.sql', table_name=temp_table)
+        self.connection.execute_query(drop_sql)
 
-        create_temp_sql = self.connection.get_sql_from_file(
-            'create_temp_table_get_links.sql')
-        create_temp_sql = create_temp_sql.format(
-            table_name=temp_table)
+        create_temp_sql = self.connection.get_statement(
+            'create_temp_table_get_links.sql', table_name=temp_table)
         self._temp_table(create_temp_sql, temp_table, 'created')
 
         BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         file_path = os.path.join(
             BASE_DIR, 'data', 'categories', f'{self.SHOP.lower()}.json')
 
-        with open(file_path, 'r+') as f:
-            d = json.load(f)
-            categories = d['data']
+        with open(file_path, 'r') as f:
+            categories = json.load(f)['data']
+
+        results = run_threaded(
+            self._extract_category, categories, self.MAX_CONCURRENT_CATEGORIES)
+        frames = [df for _, df, _ in results if df is not None]
+        n_failed = sum(1 for _, _, error in results if error is not None)
+        if n_failed:
+            logger.error(
+                f"[{self.SHOP}] {n_failed} of {len(categories)} categories failed")
+        # Most extracts log and return an empty frame rather than raise.
+        n_empty = sum(1 for _, df, error in results
+                      if error is None and (df is None or df.empty))
+        if n_empty:
+            logger.warning(
+                f"[{self.SHOP}] {n_empty} of {len(categories)} categories returned no URLs")
+        n_pages_failed = self.metrics.snapshot().get("listing.page_failed", 0)
+
+        n_urls = 0
+        if frames:
+            urls = pd.concat(frames, ignore_index=True).drop_duplicates(subset=["url"])
+            n_urls = len(urls)
+            with BulkLoader(self.connection, temp_table) as loader:
+                loader.add(urls)
+
+        self.metrics.log()
+        connection_stats.log()
+
+        # An empty category or a dropped listing page is far more likely a
+        # broken extract than products that are gone.
+        complete = not n_failed and not n_empty and not n_pages_failed and n_urls > 0
+        diff = self._sync_urls(temp_table, complete=complete)
+        self._temp_table(drop_sql, temp_table, 'deleted')
+
+        return {"urls": n_urls, "failed": n_failed, **diff}
+
+    def _sync_urls(self, temp_table: str, complete: bool) -> dict:
+        """Merge freshly discovered URLs into urls without losing scrape history.
+
+        New URLs are inserted and URLs seen again get last_seen_date bumped
+        (and are reactivated if they had vanished). Active URLs that weren't
+        found count a missed run, and are marked inactive rather than deleted
+        once they have missed VANISHED_AFTER_RUNS in a row. Nothing is
+        counted when complete is False, since a failed category would
+        otherwise look like a category whose products all vanished.
+        """
+        params = {"shop": self.SHOP, "seen": dt.now().strftime("%Y-%m-%d %H:%M:%S"),
+                  "vanish_after_runs": VANISHED_AFTER_RUNS}
+
+        def statement(file_name):
+            return self.connection.get_statement(file_name, table_name=temp_table)
+
+        diff = self.connection.extract_from_sql(
+            statement('select_url_discovery_diff.sql'), params).iloc[0]
+        counts = {"new": int(diff.n_new), "present": int(diff.n_present),
+                  "missing": int(diff.n_missing), "vanished": int(diff.n_vanished)}
+
+        self.connection.execute_query(statement('update_urls_seen.sql'), params)
+        self.connection.execute_query(statement('insert_into_urls.sql'), params)
+
+        if complete:
+            self.connection.execute_query(statement('update_urls_vanished.sql'), params)
+        else:
+            logger.warning(
+                f"[{self.SHOP}] Discovery incomplete; not counting {counts['missing']} unseen URL(s) as missed")
+            counts["vanished"] = 0
 
-            for category in categories:
-                df = self.extract(category)
-                if df is not None:
-                    self.load(df, temp_table)
+        logger.info(
+            f"[{self.SHOP}] URL discovery: {counts['new']} new, {counts['present']} still present, "
+            f"{counts['missing']} missing, {counts['vanished']} vanished")
+        return counts
 
-        insert_url_from_temp_sql = self.connection.get_sql_from_file(
-            'insert_into_urls.sql')
-        insert_url_from_temp_sql = insert_url_from_temp_sql.format(
-            table_name=temp_table)
-        self._temp_table(insert_url_from_temp_sql, temp_table, 'data inserted')
+    def _extract_category(self, category):
+        start = time.perf_counter()
+        df = self.extract(category)
+        elapsed = time.perf_counter() - start
 
-        delete_sql = f"DROP TABLE {temp_table};"
-        self._temp_table(delete_sql, temp_table, 'deleted')
+        self.metrics.observe("latency.category_ms", elapsed * 1000)
+        logger.info(
+            f"[{self.SHOP}] Category {category}: {0 if df is None else len(df)} URL(s) in {elapsed:.1f} sec")
+        return df
 
     def _temp_table(self, sql, table, method):
         self.connection.execute_query(sql)
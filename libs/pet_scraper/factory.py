@@ -1,74 +1,63 @@
-from .shops import (
-    AsdaETL,
-    BernPetFoodsETL,
-    BitibaETL,
-    BurnsPetETL,
-    DirectVetETL,
-    FarmAndPetPlaceETL,
-    FishKeeperETL,
-    HarringtonsETL,
-    HealthyPetStoreETL,
-    JollyesETL,
-    LilysKitchenETL,
-    NaturesMenuETL,
-    OcadoETL,
-    OrijenETL,
-    PetDrugsOnlineETL,
-    PetPlanetETL,
-    PetShopETL,
-    PetShopOnlineETL,
-    PetSupermarketETL,
-    PetsAtHomeETL,
-    PetsCornerETL,
-    PurinaETL,
-    TaylorPetFoodsETL,
-    TheNaturalPetStoreETL,
-    ThePetExpressETL,
-    TheRangeETL,
-    VetShopETL,
-    VetUKETL,
-    ViovetETL,
-    ZooplusETL
-)
+import threading
+import importlib
 
+from typing import Dict, TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from .etl import PetProductsETL
+
+# Entry-point style "module:Class" paths. Shop modules are only imported (and
+# their ETL constructed) when run_etl asks for them, so a job that runs one
+# shop doesn't pay for the other 29.
 SHOPS = {
-    "ASDAGroceries": AsdaETL(),
-    "BernPetFoods": BernPetFoodsETL(),
-    "Bitiba": BitibaETL(),
-    "BurnsPet": BurnsPetETL(),
-    "DirectVet": DirectVetETL(),
-    "FarmAndPetPlace": FarmAndPetPlaceETL(),
-    "FishKeeper": FishKeeperETL(),
-    "Harringtons": HarringtonsETL(),
-    "HealthyPetStore": HealthyPetStoreETL(),
-    "Jollyes": JollyesETL(),
-    "LilysKitchen": LilysKitchenETL(),
-    "NaturesMenu": NaturesMenuETL(),
-    "Ocado": OcadoETL(),
-    "Orijen": OrijenETL(),
-    "PetDrugsOnline": PetDrugsOnlineETL(),
-    "PetPlanet": PetPlanetETL(),
-    "PetShop": PetShopETL(),
-    "PetShopOnline": PetShopOnlineETL(),
-    "PetSupermarket": PetSupermarketETL(),
-    "PetsAtHome": PetsAtHomeETL(),
-    "PetsCorner": PetsCornerETL(),
-    "Purina": PurinaETL(),
-    "TaylorPetFoods": TaylorPetFoodsETL(),
-    "TheNaturalPetStore": TheNaturalPetStoreETL(),
-    "ThePetExpress": ThePetExpressETL(),
-    "TheRange": TheRangeETL(),
-    "VetShop": VetShopETL(),
-    "VetUK": VetUKETL(),
-    "Viovet": ViovetETL(),
-    "Zooplus": ZooplusETL(),
+    "ASDAGroceries": ".shops._asda:AsdaETL",
+    "BernPetFoods": ".shops._bernpetfoods:BernPetFoodsETL",
+    "Bitiba": ".shops._bitiba_etl:BitibaETL",
+    "BurnsPet": ".shops._burnspet:BurnsPetETL",
+    "DirectVet": ".shops._directvet_etl:DirectVetETL",
+    "FarmAndPetPlace": ".shops._farmandpetplace:FarmAndPetPlaceETL",
+    "FishKeeper": ".shops._fishkeeper_etl:FishKeeperETL",
+    "Harringtons": ".shops._harringtons:HarringtonsETL",
+    "HealthyPetStore": ".shops._healthypetstore:HealthyPetStoreETL",
+    "Jollyes": ".shops._jollyes_etl:JollyesETL",
+    "LilysKitchen": ".shops._lilyskitchen_etl:LilysKitchenETL",
+    "NaturesMenu": ".shops._naturesmenu:NaturesMenuETL",
+    "Ocado": ".shops._ocado:OcadoETL",
+    "Orijen": ".shops._orijen:OrijenETL",
+    "PetDrugsOnline": ".shops._petdrugsonline_etl:PetDrugsOnlineETL",
+    "PetPlanet": ".shops._petplanet_etl:PetPlanetETL",
+    "PetShop": ".shops._petshop:PetShopETL",
+    "PetShopOnline": ".shops._petshoponline:PetShopOnlineETL",
+    "PetSupermarket": ".shops._petsupermarket_etl:PetSupermarketETL",
+    "PetsAtHome": ".shops._petsathome_etl:PetsAtHomeETL",
+    "PetsCorner": ".shops._petscorner:PetsCornerETL",
+    "Purina": ".shops._purina_etl:PurinaETL",
+    "TaylorPetFoods": ".shops._taylorpetfoods:TaylorPetFoodsETL",
+    "TheNaturalPetStore": ".shops._thenaturalpetstore:TheNaturalPetStoreETL",
+    "ThePetExpress": ".shops._thepetexpress:ThePetExpressETL",
+    "TheRange": ".shops._therange:TheRangeETL",
+    "VetShop": ".shops._vetshop:VetShopETL",
+    "VetUK": ".shops._vetuk:VetUKETL",
+    "Viovet": ".shops._viovet_etl:ViovetETL",
+    "Zooplus": ".shops._zooplus_etl:ZooplusETL",
 }
 
+_instances: Dict[str, "PetProductsETL"] = {}
+_instances_lock = threading.Lock()
+
 
-def run_etl(shop: str):
-    if shop in SHOPS:
-        return SHOPS[shop]
-    else:
+def load_etl_class(shop: str) -> type:
+    if shop not in SHOPS:
         raise ValueError(
             f"Shop {shop} is not supported. Please pass a valid shop.")
+
+    module_path, class_name = SHOPS[shop].split(":")
+    module = importlib.import_module(module_path, __package__)
+    return getattr(module, class_name)
+
+
+def run_etl(shop: str) -> "PetProductsETL":
+    with _instances_lock:
+        if shop not in _instances:
+            _instances[shop] = load_etl_class(shop)()
+        return _instances[shop]
@@ -0,0 +1,205 @@
+import os
+import time
+import threading
+import httpx
+
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from loguru import logger
+from . import http_client
+from .cache import DiskCache
+
+FEEFO_RATINGS_URL = "https://api.feefo.com/api/10/products/ratings"
+# Single-SKU summaries, the second including reviews imported from other
+# platforms. Their rating is stored exactly as returned (5, not 5.0).
+FEEFO_SUMMARY_URL = "https://api.feefo.com/api/10/reviews/summary/product"
+FEEFO_IMPORTED_SUMMARY_URL = "https://api.feefo.com/api/10/importedreviews/summary/product"
+# Which field of a products/ratings entry holds the SKU it was asked for by.
+RESPONSE_SKU_FIELDS = {"product_sku": "sku", "parent_product_sku": "parent_sku"}
+FEEFO_TTL_HOURS = float(os.getenv("FEEFO_TTL_HOURS", "72"))
+FEEFO_BATCH_SIZE = int(os.getenv("FEEFO_BATCH_SIZE", "50"))
+# Ratings no product has asked for in this long are dropped instead of
+# refreshed, so SKUs that left the catalogue stop costing requests.
+FEEFO_RETENTION_DAYS = float(os.getenv("FEEFO_RETENTION_DAYS", "14"))
+
+
+class FeefoRatings:
+    """Feefo product ratings for one merchant, served from a TTL disk cache.
+
+    Cache misses are fetched through the products/ratings endpoint, which
+    takes a comma-separated list of SKUs, so refreshing known SKUs at the
+    start of a run costs one request per FEEFO_BATCH_SIZE products. Inside
+    deferring(), misses are collected instead so the caller can fetch them
+    in batches too. Merchants whose ratings come from a summary endpoint
+    pass it as summary_url; those take one SKU per request.
+    """
+
+    def __init__(self, merchant: str, sku_param: str = "parent_product_sku", ttl_hours: float = None,
+                 batch_size: int = None, summary_url: str = None, origin: str = None):
+        self.merchant = merchant
+        self.sku_param = sku_param
+        self.ttl = (ttl_hours or FEEFO_TTL_HOURS) * 3600
+        self.batch_size = batch_size or FEEFO_BATCH_SIZE
+        self.summary_url = summary_url
+        # Summary ratings are kept apart from products/ratings ones, which
+        # are floats and may come from a different review set.
+        self.namespace = f"{merchant}/summary" if summary_url else merchant
+        self.origin = origin
+        self._cache: Optional[DiskCache] = None
+        # Per thread, as in-process transforms run on executor threads.
+        self._local = threading.local()
+        self._touched: Set[str] = set()
+
+    @property
+    def cache(self) -> DiskCache:
+        # Opened on first use, so constructing a shop has no side effects.
+        if self._cache is None:
+            self._cache = DiskCache("feefo")
+        return self._cache
+
+    def _key(self, sku: str, sku_param: str) -> str:
+        return f"{self.namespace}:{sku_param}:{sku}"
+
+    def _touch(self, key: str) -> None:
+        """Record that key was read, at most once per process"""
+        if key not in self._touched:
+            self._touched.add(key)
+            self.cache.set(f"used:{key}", time.time())
+
+    def _get_json(self, url: str, params: dict) -> Optional[dict]:
+        """GET a Feefo endpoint; None (and the cache left as it is) on any failure"""
+        try:
+            response = http_client.get(url, params=params)
+            if response.status_code != 200:
+                logger.warning(
+                    f"Feefo request for {self.merchant} failed: HTTP {response.status_code}")
+                return None
+            return response.json()
+        except (httpx.HTTPError, ValueError) as e:
+            logger.warning(f"Feefo request for {self.merchant} failed: {e}")
+            return None
+
+    def _fetch(self, skus: List[str], sku_param: str) -> None:
+        if self.summary_url:
+            for sku in skus:
+                self._fetch_summary(sku, sku_param)
+            return
+
+        data = self._get_json(FEEFO_RATINGS_URL, {
+            "merchant_identifier": self.merchant,
+            sku_param: ",".join(skus),
+            "since_period": "ALL",
+            "review_count": "true",
+        })
+        if data is None:
+            return
+
+        field = RESPONSE_SKU_FIELDS.get(sku_param, "sku")
+        ratings = {}
+        try:
+            for product in data.get("products", []):
+                sku = product.get(field)
+                if sku is None and len(skus) == 1:
+                    sku = skus[0]
+                if sku is not None and product.get("rating") is not None:
+                    ratings[str(sku)] = float(product["rating"])
+        except (AttributeError, TypeError, ValueError) as e:
+            logger.warning(f"Unexpected Feefo ratings response for {self.merchant}: {e}")
+            return
+
+        # SKUs missing from the response have no reviews yet; cache that too
+        # so they aren't asked for again until the entry goes stale.
+        self.cache.set_many({
+            self._key(sku, sku_param): {"rating": ratings.get(sku)} for sku in skus
+        })
+
+    def _fetch_summary(self, sku: str, sku_param: str) -> None:
+        params = {"merchant_identifier": self.merchant, sku_param: sku, "since_period": "ALL"}
+        if self.origin:
+            params["origin"] = self.origin
+        data = self._get_json(self.summary_url, params)
+        if data is None:
+            return
+
+        try:
+            rating = (data.get("rating") or {}).get("rating")
+            if rating is not None and not isinstance(rating, (int, float)):
+                raise ValueError(f"rating is {rating!r}")
+        except (AttributeError, ValueError) as e:
+            logger.warning(f"Unexpected Feefo summary response for {self.merchant}: {e}")
+            return
+
+        self.cache.set(self._key(sku, sku_param), {"rating": rating})
+
+    def prefetch(self, skus: Iterable[str], sku_param: str = None) -> None:
+        """Fetch ratings for skus in batches, skipping ones cached and fresh"""
+        sku_param = sku_param or self.sku_param
+        missing = [
+            sku for sku in dict.fromkeys(str(s) for s in skus)
+            if self.cache.get(self._key(sku, sku_param), self.ttl) is None
+        ]
+
+        for i in range(0, len(missing), self.batch_size):
+            self._fetch(missing[i:i + self.batch_size], sku_param)
+
+    def refresh_stale(self) -> None:
+        """Re-fetch expired ratings of this merchant, dropping those not read within FEEFO_RETENTION_DAYS"""
+        by_param: Dict[str, List[str]] = defaultdict(list)
+        unused = []
+        used_since = time.time() - FEEFO_RETENTION_DAYS * 86400
+        for key in self.cache.stale_keys(f"{self.namespace}:", self.ttl):
+            used_at = self.cache.get(f"used:{key}")
+            if used_at is None or used_at < used_since:
+                unused.append(key)
+                continue
+            _, sku_param, sku = key.split(":", 2)
+            by_param[sku_param].append(sku)
+
+        if unused:
+            logger.info(
+                f"Dropping {len(unused)} Feefo rating(s) for {self.merchant} not read "
+                f"in {FEEFO_RETENTION_DAYS:g} days")
+            self.cache.delete_many(unused + [f"used:{key}" for key in unused])
+
+        for sku_param, skus in by_param.items():
+            logger.info(
+                f"Refreshing {len(skus)} stale Feefo rating(s) for {self.merchant}")
+            self.prefetch(skus, sku_param)
+
+    @contextmanager
+    def deferring(self) -> Iterator[List[Tuple[str, str]]]:
+        """Within the block, rating() records misses as (sku, sku_param) in the yielded list instead of fetching"""
+        self._local.deferred = misses = []
+        try:
+            yield misses
+        finally:
+            self._local.deferred = None
+
+    def prefetch_deferred(self, misses: Iterable[Tuple[str, str]]) -> None:
+        """Fetch the misses collected by deferring(), batched per SKU parameter"""
+        by_param: Dict[str, List[str]] = defaultdict(list)
+        for sku, sku_param in misses:
+            by_param[sku_param].append(sku)
+
+        for sku_param, skus in by_param.items():
+            self.prefetch(skus, sku_param)
+
+    def rating(self, sku: str, sku_param: str = None) -> Optional[float]:
+        """Cached rating for sku, fetching it on a miss; None when it has no reviews"""
+        sku_param = sku_param or self.sku_param
+        key = self._key(str(sku), sku_param)
+
+        entry = self.cache.get(key, self.ttl)
+        deferred = getattr(self._local, "deferred", None)
+        if entry is None and deferred is not None:
+            deferred.append((str(sku), sku_param))
+            return None
+        if entry is None:
+            self.prefetch([sku], sku_param)
+            entry = self.cache.get(key)
+
+        if entry is None:
+            return None
+        self._touch(key)
+        return entry["rating"]
@@ -0,0 +1,46 @@
+import re
+import json
+import hashlib
+import pandas as pd
+
+from typing import Any, Optional
+from bs4 import BeautifulSoup
+
+# Matches the scale of the NUMERIC(10, 4) price columns, so float noise
+# below what the database stores never counts as a change.
+FLOAT_DECIMALS = 4
+
+
+def _normalise(value: Any) -> Any:
+    if value is None or (isinstance(value, float) and value != value):
+        return None
+    if isinstance(value, str):
+        return re.sub(r"\s+", " ", value).strip() or None
+    if isinstance(value, float):
+        return round(value, FLOAT_DECIMALS)
+    if hasattr(value, "item"):
+        # numpy scalars
+        return _normalise(value.item())
+    return value
+
+
+def _digest(payload: Any) -> str:
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def fingerprint_frame(data: pd.DataFrame) -> str:
+    """sha256 of a transform() result, independent of row and column order and whitespace"""
+    columns = sorted(data.columns)
+    rows = [[_normalise(value) for value in row]
+            for row in data[columns].itertuples(index=False, name=None)]
+    rows.sort(key=lambda row: json.dumps(row, default=str))
+    return _digest({"columns": columns, "rows": rows})
+
+
+def fingerprint_fragment(soup: BeautifulSoup, selector: str) -> Optional[str]:
+    """sha256 of the elements matching selector, or None when nothing matches"""
+    elements = soup.select(selector)
+    if not elements:
+        return None
+    return _digest([re.sub(r"\s+", " ", str(element)).strip() for element in elements])
@@ -0,0 +1,255 @@
+import os
+import asyncio
+import weakref
+import threading
+import httpx
+
+from collections import Counter, defaultdict
+from typing import Dict, Optional
+from fake_useragent import UserAgent
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    retry_if_result,
+    stop_after_attempt,
+    wait_exponential,
+    before_sleep_log
+)
+from loguru import logger
+from .scraper import RawPage
+from .cache import CachedResponse, get_response_cache
+from .metrics import ShopMetrics
+
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "30"))
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "20"))
+HTTP_MAX_KEEPALIVE = int(os.getenv("HTTP_MAX_KEEPALIVE", "10"))
+HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "3"))
+RETRY_STATUSES = {429, 502, 503, 504}
+
+# Browser-like defaults. httpx negotiates gzip/deflate/br itself (br needs
+# the brotli package), so no Accept-Encoding here.
+DEFAULT_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-GB,en;q=0.9",
+    "Upgrade-Insecure-Requests": "1",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "none",
+    "Sec-Fetch-User": "?1",
+}
+
+
+class ConnectionStats:
+    """Per-host request and new-connection counts, to see keep-alive reuse"""
+
+    def __init__(self):
+        self._counts: Dict[str, Counter] = defaultdict(Counter)
+        self._lock = threading.Lock()
+
+    def incr(self, host: str, name: str) -> None:
+        with self._lock:
+            self._counts[host][name] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {host: dict(counts) for host, counts in self._counts.items()}
+
+    def log(self) -> None:
+        for host, counts in sorted(self.snapshot().items()):
+            n_requests = counts.get("requests", 0)
+            n_connections = counts.get("connections", 0)
+            reused = n_requests - n_connections
+            ratio = reused / n_requests if n_requests else 0.0
+            logger.info(
+                f"HTTP {host}: {n_requests} request(s) over {n_connections} connection(s), {ratio:.0%} reused")
+
+
+connection_stats = ConnectionStats()
+
+
+def _client_options() -> dict:
+    return {
+        "http2": True,
+        "follow_redirects": True,
+        "timeout": HTTP_TIMEOUT,
+        "limits": httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS,
+                               max_keepalive_connections=HTTP_MAX_KEEPALIVE),
+        "headers": {**DEFAULT_HEADERS, "User-Agent": UserAgent().random},
+    }
+
+
+def _is_retryable(response: httpx.Response) -> bool:
+    return response.status_code in RETRY_STATUSES
+
+
+def _last_outcome(retry_state):
+    # Give the caller the final response (or exception) once retries run out.
+    return retry_state.outcome.result()
+
+
+_retry = retry(
+    wait=wait_exponential(multiplier=1, min=1, max=10),
+    stop=stop_after_attempt(HTTP_MAX_RETRIES),
+    retry=retry_if_exception_type(
+        httpx.TransportError) | retry_if_result(_is_retryable),
+    before_sleep=before_sleep_log(logger, "WARNING"),
+    retry_error_callback=_last_outcome,
+)
+
+
+# Sync face: one thread-safe client per verify setting, shared process-wide.
+_sync_clients: Dict[bool, httpx.Client] = {}
+_sync_clients_lock = threading.Lock()
+
+
+def get_client(verify: bool = True) -> httpx.Client:
+    with _sync_clients_lock:
+        client = _sync_clients.get(verify)
+        if client is None or client.is_closed:
+            client = httpx.Client(verify=verify, **_client_options())
+            _sync_clients[verify] = client
+
+        return client
+
+
+def _sync_trace(host: str):
+    def trace(event_name, info):
+        if event_name == "connection.connect_tcp.complete":
+            connection_stats.incr(host, "connections")
+    return trace
+
+
+def _async_trace(host: str):
+    async def trace(event_name, info):
+        if event_name == "connection.connect_tcp.complete":
+            connection_stats.incr(host, "connections")
+    return trace
+
+
+def _accept(headers: Optional[Dict[str, str]]) -> str:
+    for name, value in (headers or {}).items():
+        if name.lower() == "accept":
+            return value
+    return DEFAULT_HEADERS["Accept"]
+
+
+def _replay(cached: CachedResponse, url: str) -> httpx.Response:
+    return httpx.Response(cached.status, headers=cached.headers, content=cached.body,
+                          request=httpx.Request("GET", url))
+
+
+def _count(metrics: Optional[ShopMetrics], name: str) -> None:
+    if metrics is not None:
+        metrics.incr(name)
+
+
+def _prepare(url: str, headers: Optional[Dict[str, str]], params: Optional[dict], metrics: Optional[ShopMetrics]):
+    """Resolve the cache entry for a GET: (url, accept, cached, headers, replay)"""
+    url = str(httpx.URL(url, params=params)) if params else url
+    cache = get_response_cache()
+    accept = _accept(headers)
+    cached = cache.lookup(url, accept) if cache else None
+
+    if cached is not None and cached.fresh:
+        _count(metrics, "cache.hit")
+        return url, accept, cached, headers, _replay(cached, url)
+
+    if cached is not None:
+        headers = {**(headers or {}), **cached.validators()}
+
+    return url, accept, cached, headers, None
+
+
+def _settle(url: str, accept: str, cached: Optional[CachedResponse], response: httpx.Response, metrics: Optional[ShopMetrics]) -> httpx.Response:
+    cache = get_response_cache()
+    if cached is not None and response.status_code == 304:
+        _count(metrics, "cache.revalidated")
+        cache.revalidated(url, accept, response.headers)
+        return _replay(cached, url)
+
+    _count(metrics, "cache.miss")
+    if cache is not None:
+        cache.store(url, accept, response.status_code,
+                    response.headers, response.content)
+
+    return response
+
+
+def is_fresh(url: str, headers: Optional[Dict[str, str]] = None) -> bool:
+    """Whether url can be served from the response cache without a request"""
+    cache = get_response_cache()
+    cached = cache.lookup(url, _accept(headers)) if cache else None
+    return cached is not None and cached.fresh
+
+
+@_retry
+def _get(url: str, headers: Optional[Dict[str, str]], verify: bool, **kwargs) -> httpx.Response:
+    host = httpx.URL(url).host
+    connection_stats.incr(host, "requests")
+    return get_client(verify).get(
+        url, headers=headers, extensions={"trace": _sync_trace(host)}, **kwargs)
+
+
+def get(url: str, headers: Optional[Dict[str, str]] = None, params: Optional[dict] = None, verify: bool = True,
+        metrics: Optional[ShopMetrics] = None, **kwargs) -> httpx.Response:
+    """Blocking GET over the shared pooled client.
+
+    Served from the response cache when fresh, revalidated with
+    If-None-Match/If-Modified-Since when stale; transient failures are
+    retried.
+    """
+    url, accept, cached, headers, replay = _prepare(url, headers, params, metrics)
+    if replay is not None:
+        return replay
+
+    return _settle(url, accept, cached, _get(url, headers, verify, **kwargs), metrics)
+
+
+# Async face: httpx async clients are bound to the loop that opened their
+# connections, so keep one per loop, like the browser pool.
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def get_async_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(**_client_options())
+        _async_clients[loop] = client
+
+    return client
+
+
+async def close_async_client() -> None:
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client:
+        await client.aclose()
+
+
+@_retry
+async def _aget(url: str, headers: Optional[Dict[str, str]], **kwargs) -> httpx.Response:
+    host = httpx.URL(url).host
+    connection_stats.incr(host, "requests")
+    return await get_async_client().get(
+        url, headers=headers, extensions={"trace": _async_trace(host)}, **kwargs)
+
+
+async def aget(url: str, headers: Optional[Dict[str, str]] = None, params: Optional[dict] = None,
+               metrics: Optional[ShopMetrics] = None, **kwargs) -> httpx.Response:
+    """Non-blocking GET over this loop's pooled client, with the same caching as get"""
+    url, accept, cached, headers, replay = _prepare(url, headers, params, metrics)
+    if replay is not None:
+        return replay
+
+    return _settle(url, accept, cached, await _aget(url, headers, **kwargs), metrics)
+
+
+async def fetch_page(url: str, headers: Optional[Dict[str, str]] = None, metrics: Optional[ShopMetrics] = None) -> Optional[RawPage]:
+    """GET url over the pooled client; None on network errors"""
+    try:
+        response = await aget(url, headers=headers, metrics=metrics)
+    except httpx.HTTPError as e:
+        logger.warning(f"HTTP fetch failed for {url}: {e}")
+        return None
+
+    return RawPage(str(response.url), response.status_code, dict(response.headers), response.content)
@@ -0,0 +1,97 @@
+import bisect
+import threading
+
+from collections import Counter
+from typing import Dict, List
+from loguru import logger
+
+# Upper bounds (ms) of the latency histogram buckets, plus an open-ended one.
+LATENCY_BUCKETS_MS = (250, 500, 1000, 2000, 4000, 8000, 16000, 32000)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram"""
+
+    def __init__(self, bounds=LATENCY_BUCKETS_MS):
+        self.bounds = bounds
+        self.labels = [f"<={b}" for b in bounds] + [f">{bounds[-1]}"]
+        self.buckets: List[int] = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        self.buckets[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def quantile(self, q: float) -> str:
+        """Label of the bucket holding the q-th observation"""
+        seen = 0
+        for label, n in zip(self.labels, self.buckets):
+            seen += n
+            if n and seen >= q * self.count:
+                return label
+        return "-"
+
+    def summary(self) -> str:
+        buckets = " ".join(f"{label}:{n}" for label, n in zip(self.labels, self.buckets) if n)
+        return (f"n={self.count} mean={self.total / self.count:.0f} "
+                f"p50{self.quantile(0.5)} p90{self.quantile(0.9)} [{buckets}]")
+
+
+class ShopMetrics:
+    """Thread-safe counters and latency histograms for one shop's scraping run"""
+
+    def __init__(self, shop: str):
+        self.shop = shop
+        self.counters: Counter = Counter()
+        self.histograms: Dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def incr(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self.counters[name] += n
+
+    def observe(self, name: str, value: float) -> None:
+        with self._lock:
+            if name not in self.histograms:
+                self.histograms[name] = Histogram()
+            self.histograms[name].observe(value)
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.counters)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+    def log(self) -> None:
+        counters = self.snapshot()
+        if counters.get("transfer.pages"):
+            counters["transfer.kb_per_page"] = round(
+                counters["transfer.bytes"] / counters["transfer.pages"] / 1024)
+        browser_ms = counters.get("time.network_ms", 0) + counters.get("time.behavior_ms", 0)
+        if browser_ms:
+            counters["time.behavior_pct"] = round(
+                100 * counters.get("time.behavior_ms", 0) / browser_ms)
+        if counters:
+            logger.info(
+                f"[{self.shop}] metrics: " + ", ".join(f"{k}={v}" for k, v in sorted(counters.items())))
+
+        with self._lock:
+            summaries = {name: h.summary() for name, h in self.histograms.items()}
+        for name, summary in sorted(summaries.items()):
+            logger.info(f"[{self.shop}] {name}: {summary}")
+
+
+_metrics: Dict[str, ShopMetrics] = {}
+_metrics_lock = threading.Lock()
+
+
+def get_metrics(shop: str) -> ShopMetrics:
+    with _metrics_lock:
+        if shop not in _metrics:
+            _metrics[shop] = ShopMetrics(shop)
+        return _metrics[shop]
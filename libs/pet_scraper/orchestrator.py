@@ -0,0 +1,100 @@
+import datetime as dt
+
+from typing import Dict, List, Optional
+from loguru import logger
+from .factory import SHOPS, run_etl
+from .runner import run_threaded
+
+STAGES = {
+    "links": "get_links_by_category",
+    "products": "get_product_infos",
+}
+
+
+class ShopReport:
+    def __init__(self, shop: str):
+        self.shop = shop
+        self.stages: Dict[str, dict] = {}
+        self.error: Optional[Exception] = None
+
+    def record(self, stage: str, counts: Optional[dict], elapsed: dt.timedelta) -> None:
+        self.stages[stage] = {"counts": counts or {}, "elapsed": elapsed}
+
+
+def run_shop(shop: str, stages: List[str], max_concurrent: Optional[int] = None) -> ShopReport:
+    # The client is shared with every other run of this shop in the
+    # process, so overrides are passed per call rather than set on it.
+    client = run_etl(shop)
+    options = {"products": {"max_concurrent": max_concurrent}}
+
+    report = ShopReport(shop)
+    for stage in stages:
+        logger.info(f"[{shop}] {stage} has started")
+        start_time = dt.datetime.now()
+
+        try:
+            counts = getattr(client, STAGES[stage])(**options.get(stage, {}))
+        except Exception as e:
+            logger.error(f"[{shop}] {stage} failed: {e}")
+            report.error = e
+            report.record(stage, None, dt.datetime.now() - start_time)
+            break
+
+        report.record(stage, counts, dt.datetime.now() - start_time)
+        logger.info(f"[{shop}] {stage} has ended. Elapsed: {report.stages[stage]['elapsed']}")
+
+    return report
+
+
+def run_shops(shops: List[str], stages: List[str], max_shops: int = 4, max_concurrent: Optional[int] = None) -> List[ShopReport]:
+    """Run the given stages for many shops at once in this process.
+
+    max_shops caps how many shops run at the same time; max_concurrent, when
+    set, overrides each shop's MAX_CONCURRENT_PRODUCT_INFO. Each shop runs in
+    its own thread and event loop, and all of them share the process-wide
+    politeness scheduler, so one shop's waits overlap with others' work.
+    """
+    for shop in shops:
+        if shop not in SHOPS:
+            raise ValueError(
+                f"Shop {shop} is not supported. Please pass a valid shop.")
+    for stage in stages:
+        if stage not in STAGES:
+            raise ValueError(
+                f"Stage {stage} is not supported. Value must be in {list(STAGES)}")
+
+    results = run_threaded(
+        lambda shop: run_shop(shop, stages, max_concurrent), shops, max_shops)
+
+    reports = []
+    for shop, report, error in results:
+        if report is None:
+            report = ShopReport(shop)
+            report.error = error
+        reports.append(report)
+
+    return reports
+
+
+def log_summary(reports: List[ShopReport]) -> None:
+    lines = [f"{'Shop':<20}{'Stage':<10}{'Items':>8}{'Failed':>8}{'Elapsed':>18}{'Items/min':>11}"]
+
+    for report in reports:
+        if not report.stages:
+            lines.append(f"{report.shop:<20}{'-':<10}{'ERROR: ' + str(report.error)}")
+            continue
+
+        for stage, result in report.stages.items():
+            counts = result["counts"]
+            n_items = counts.get("urls", counts.get("done", 0) + counts.get("failed", 0))
+            n_failed = counts.get("failed", 0)
+            minutes = result["elapsed"].total_seconds() / 60
+            rate = n_items / minutes if minutes > 0 else 0.0
+
+            lines.append(
+                f"{report.shop:<20}{stage:<10}{n_items:>8}{n_failed:>8}{str(result['elapsed']).split('.')[0]:>18}{rate:>11.1f}")
+
+        if report.error:
+            lines.append(f"{'':<20}ERROR: {report.error}")
+
+    logger.info("Multi-shop run summary:\n" + "\n".join(lines))
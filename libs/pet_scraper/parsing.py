@@ -0,0 +1,79 @@
+import os
+import atexit
+import threading
+import multiprocessing
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Union
+from bs4 import BeautifulSoup
+from loguru import logger
+
+PARSER_BACKENDS = ("lxml", "html.parser", "html5lib")
+
+# lxml is considerably faster, but repairs malformed markup differently
+# from html.parser, which position-dependent lookups in transform() can
+# notice. Shops opt in through their HTML_PARSER attribute once
+# benchmarks/bench_parsers.py --compare shows identical output for them.
+DEFAULT_HTML_PARSER = "html.parser"
+HTML_PARSER = os.getenv("HTML_PARSER", DEFAULT_HTML_PARSER)
+
+if HTML_PARSER not in PARSER_BACKENDS:
+    raise ValueError(
+        f"HTML_PARSER must be one of {list(PARSER_BACKENDS)}, got {HTML_PARSER!r}")
+
+
+def make_soup(markup: Union[str, bytes], parser: Optional[str] = None) -> BeautifulSoup:
+    """Parse markup with the configured backend"""
+    return BeautifulSoup(markup, parser or HTML_PARSER)
+
+
+PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_parse_executor() -> Optional[ProcessPoolExecutor]:
+    """Process pool shared by every ETL in this process; None when PARSE_WORKERS=0"""
+    global _executor
+    if PARSE_WORKERS <= 0:
+        return None
+
+    with _executor_lock:
+        if _executor is None:
+            # spawn, not fork: the orchestrator runs shops on threads, and
+            # forking a threaded process can deadlock the child.
+            _executor = ProcessPoolExecutor(
+                PARSE_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+            logger.info(f"Started {PARSE_WORKERS} parse worker process(es)")
+
+        return _executor
+
+
+def discard_parse_executor(broken: ProcessPoolExecutor) -> None:
+    """Drop broken if it is still the shared pool, so the next caller starts a new one.
+
+    Callers that saw the same failure late find a newer pool in place and
+    leave it alone. Nothing is waited on, and futures of other callers are
+    not cancelled: a broken pool has already failed them.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is not broken:
+            return
+        _executor = None
+
+    broken.shutdown(wait=False)
+
+
+def shutdown_parse_executor() -> None:
+    """Stop the parse workers; the next get_parse_executor starts new ones"""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+
+    if executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+atexit.register(shutdown_parse_executor)
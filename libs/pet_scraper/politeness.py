@@ -0,0 +1,101 @@
+import time
+import asyncio
+import threading
+
+from typing import Dict, Optional
+from urllib.parse import urlparse
+from loguru import logger
+
+DEFAULT_REQUESTS_PER_MINUTE = 20
+DEFAULT_BURST = 1
+
+
+def host_of(url: str) -> str:
+    return urlparse(url).netloc.lower()
+
+
+def requests_per_minute_from_sleep(min_sec: float, max_sec: float) -> float:
+    """Translate a legacy random sleep window into an equivalent request rate"""
+    mean_sec = (min_sec + max_sec) / 2
+    return 60 / mean_sec if mean_sec > 0 else DEFAULT_REQUESTS_PER_MINUTE
+
+
+class TokenBucket:
+    """Reservation-style token bucket: each request is told how long to wait"""
+
+    def __init__(self, requests_per_minute: float, burst: int = DEFAULT_BURST):
+        self.requests_per_minute = requests_per_minute
+        self.rate = requests_per_minute / 60
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+
+    def reserve(self) -> float:
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens +
+                          (now - self.updated) * self.rate)
+        self.updated = now
+
+        # Going negative books a slot in the future, so concurrent callers
+        # queue up one interval apart instead of all waking together.
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+
+        return -self.tokens / self.rate
+
+
+class PolitenessScheduler:
+    """Per-host request budgets shared by every fetch path in the process"""
+
+    def __init__(self):
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def set_budget(self, host: str, requests_per_minute: float, burst: int = DEFAULT_BURST) -> None:
+        with self._lock:
+            self._buckets[host] = TokenBucket(requests_per_minute, burst)
+        logger.info(
+            f"Politeness budget for {host}: {requests_per_minute:.2f} req/min, burst {burst}")
+
+    def has_budget(self, host: str) -> bool:
+        return host in self._buckets
+
+    def _reserve(self, url: str, requests_per_minute: Optional[float] = None) -> float:
+        host = host_of(url)
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(
+                    requests_per_minute or DEFAULT_REQUESTS_PER_MINUTE)
+                self._buckets[host] = bucket
+
+            delay = bucket.reserve()
+
+        if delay > 0:
+            if delay >= 60:
+                logger.info(
+                    f"Politeness wait for {host}: {int(delay // 60)} min {delay % 60:.2f} sec")
+            else:
+                logger.info(f"Politeness wait for {host}: {delay:.2f} sec")
+
+        return delay
+
+    async def acquire(self, url: str, requests_per_minute: Optional[float] = None) -> None:
+        """Wait (without blocking the event loop) until url's host may be hit"""
+        delay = self._reserve(url, requests_per_minute)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def wait(self, url: str, requests_per_minute: Optional[float] = None) -> None:
+        """Blocking variant of acquire for synchronous fetch paths"""
+        delay = self._reserve(url, requests_per_minute)
+        if delay > 0:
+            time.sleep(delay)
+
+
+_scheduler = PolitenessScheduler()
+
+
+def get_scheduler() -> PolitenessScheduler:
+    return _scheduler
@@ -0,0 +1,170 @@
+import os
+import asyncio
+
+from typing import Iterable, Optional
+from urllib.parse import urlsplit
+from playwright.async_api import Page, Route, Request
+from loguru import logger
+from .cache import get_response_cache
+from .metrics import ShopMetrics
+
+BLOCK_REQUESTS = os.getenv("BROWSER_BLOCK_REQUESTS", "1") == "1"
+# Serving main-frame navigations from the response cache. Off by default:
+# cache misses are re-fetched through route.fetch(), whose TLS and header
+# fingerprint is Playwright's rather than the browser's, which bot
+# protection may notice. Turn it on only after checking a shop with it.
+BROWSER_DOCUMENT_CACHE = os.getenv("BROWSER_DOCUMENT_CACHE", "0") == "1"
+
+# We only read the DOM, so nothing that is painted or played is needed.
+DEFAULT_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+# Analytics, tag managers, ads and session replay. Subdomains match too.
+DEFAULT_BLOCKED_DOMAINS = frozenset({
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googleadservices.com",
+    "googlesyndication.com",
+    "doubleclick.net",
+    "adservice.google.com",
+    "facebook.net",
+    "bat.bing.com",
+    "clarity.ms",
+    "hotjar.com",
+    "hotjar.io",
+    "analytics.tiktok.com",
+    "sc-static.net",
+    "criteo.com",
+    "criteo.net",
+    "taboola.com",
+    "outbrain.com",
+    "quantserve.com",
+    "scorecardresearch.com",
+    "newrelic.com",
+    "nr-data.net",
+    "segment.io",
+    "cdn.segment.com",
+    "mouseflow.com",
+    "fullstory.com",
+    "quantummetric.com",
+    "contentsquare.net",
+    "awin1.com",
+    "dwin1.com",
+    "pepperjam.com",
+})
+
+
+def _host_in(host: str, domains: Iterable[str]) -> bool:
+    parts = host.split(".")
+    return any(".".join(parts[i:]) in domains for i in range(len(parts)))
+
+
+class RequestFilter:
+    """Per-shop deny lists for resource types and domains, with an allow list that wins"""
+
+    def __init__(self, blocked_resource_types: Optional[Iterable[str]] = None,
+                 blocked_domains: Optional[Iterable[str]] = None,
+                 allowed_domains: Iterable[str] = ()):
+        self.blocked_resource_types = frozenset(
+            DEFAULT_BLOCKED_RESOURCE_TYPES if blocked_resource_types is None else blocked_resource_types)
+        self.blocked_domains = frozenset(
+            DEFAULT_BLOCKED_DOMAINS if blocked_domains is None else blocked_domains)
+        self.allowed_domains = frozenset(allowed_domains)
+
+    def reason(self, request: Request) -> Optional[str]:
+        """Why request should be dropped ("image", "tracker", ...), or None to let it through"""
+        host = urlsplit(request.url).hostname or ""
+        if self.allowed_domains and _host_in(host, self.allowed_domains):
+            return None
+        if self.blocked_domains and _host_in(host, self.blocked_domains):
+            return "tracker"
+        if request.resource_type in self.blocked_resource_types:
+            return request.resource_type
+        return None
+
+
+def _is_main_frame_navigation(request: Request) -> bool:
+    return request.is_navigation_request() and request.frame.parent_frame is None
+
+
+class PageRouter:
+    """page.route handler for one page.
+
+    Drops filtered requests, serves main-frame navigations through the
+    response cache when BROWSER_DOCUMENT_CACHE is on and adds up the bytes
+    the page pulled over the network.
+    """
+
+    def __init__(self, request_filter: Optional[RequestFilter] = None, metrics: Optional[ShopMetrics] = None):
+        self.request_filter = request_filter
+        self.metrics = metrics
+        self._finished = []
+        self._served_locally = set()
+
+    def _count(self, name: str, n: int = 1) -> None:
+        if self.metrics is not None:
+            self.metrics.incr(name, n)
+
+    async def install(self, page: Page) -> None:
+        page.on("requestfinished", self._finished.append)
+        await page.route("**/*", self.handle)
+
+    async def handle(self, route: Route, request: Request) -> None:
+        reason = self.request_filter.reason(request) if self.request_filter else None
+        if reason:
+            self._count(f"blocked.{reason}")
+            await route.abort("blockedbyclient")
+            return
+
+        cache = get_response_cache() if BROWSER_DOCUMENT_CACHE else None
+        if cache is None or request.method != "GET" or not _is_main_frame_navigation(request):
+            await route.continue_()
+            return
+
+        await self._serve_document(cache, route, request)
+
+    async def _serve_document(self, cache, route: Route, request: Request) -> None:
+        """Serve navigations through the response cache, revalidating stale copies"""
+        accept = request.headers.get("accept", "")
+        cached = cache.lookup(request.url, accept)
+        if cached is not None and cached.fresh:
+            self._count("cache.hit")
+            self._served_locally.add(request)
+            await route.fulfill(status=cached.status, headers=cached.headers, body=cached.body)
+            return
+
+        headers = {**request.headers, **
+                   (cached.validators() if cached is not None else {})}
+        # Redirects go back to the browser so each hop is its own navigation.
+        response = await route.fetch(headers=headers, max_redirects=0)
+
+        if cached is not None and response.status == 304:
+            self._count("cache.revalidated")
+            self._served_locally.add(request)
+            cache.revalidated(request.url, accept, response.headers)
+            await route.fulfill(status=cached.status, headers=cached.headers, body=cached.body)
+            return
+
+        self._count("cache.miss")
+        body = await response.body()
+        cache.store(request.url, accept, response.status, response.headers, body)
+        await route.fulfill(response=response, body=body)
+
+    async def record_transfer(self, url: str) -> int:
+        """Add the bytes received for this page to the shop's transfer counters"""
+        requests = [r for r in self._finished if r not in self._served_locally]
+        sizes = await asyncio.gather(*(r.sizes() for r in requests), return_exceptions=True)
+        n_bytes = sum(max(0, s["responseBodySize"]) + max(0, s["responseHeadersSize"])
+                      for s in sizes if isinstance(s, dict))
+
+        self._count("transfer.pages")
+        self._count("transfer.bytes", n_bytes)
+        logger.debug(f"{url}: {len(requests)} request(s), {n_bytes / 1024:.0f} KB received")
+        return n_bytes
+
+
+async def prepare_page(page: Page, request_filter: Optional[RequestFilter] = None,
+                       metrics: Optional[ShopMetrics] = None) -> PageRouter:
+    """Install request filtering, document caching and transfer accounting on page"""
+    router = PageRouter(request_filter, metrics)
+    await router.install(page)
+    return router
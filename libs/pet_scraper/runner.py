@@ -0,0 +1,61 @@
+import queue
+import asyncio
+import threading
+import nest_asyncio
+
+from typing import Any, Callable, Iterable, List, Tuple
+from loguru import logger
+from .browser_pool import close_browser_pool
+from .http_client import close_async_client
+
+
+def _worker(fn: Callable, jobs: queue.Queue, results: list) -> None:
+    # Shop code drives Playwright through asyncio.run, so every worker thread
+    # gets its own (re-entrant) event loop and therefore its own browser pool.
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    nest_asyncio.apply(loop)
+
+    try:
+        while True:
+            try:
+                index, item = jobs.get_nowait()
+            except queue.Empty:
+                break
+
+            try:
+                results[index] = (item, fn(item), None)
+            except Exception as e:
+                logger.error(f"Task for {item} failed: {e}")
+                results[index] = (item, None, e)
+
+    finally:
+        try:
+            loop.run_until_complete(close_browser_pool())
+            loop.run_until_complete(close_async_client())
+        finally:
+            loop.close()
+
+
+def run_threaded(fn: Callable[[Any], Any], items: Iterable[Any], max_workers: int) -> List[Tuple[Any, Any, Exception]]:
+    """Run fn over items on up to max_workers threads.
+
+    Returns (item, result, error) tuples in the same order as items.
+    """
+    items = list(items)
+    results: list = [None] * len(items)
+
+    jobs: queue.Queue = queue.Queue()
+    for index, item in enumerate(items):
+        jobs.put((index, item))
+
+    threads = [
+        threading.Thread(target=_worker, args=(fn, jobs, results), daemon=True)
+        for _ in range(max(1, min(max_workers, len(items))))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return results
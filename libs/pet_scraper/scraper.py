@@ -1,9 +1,10 @@
+import time
 import random
 import asyncio
 import nest_asyncio
 
-from typing import Optional, Dict, Any
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+from typing import Optional, Dict, Any, Union
+from playwright.async_api import Page
 from fake_useragent import UserAgent
 from bs4 import BeautifulSoup
 from tenacity import (
@@ -14,6 +15,11 @@ from tenacity import (
     before_sleep_log
 )
 from loguru import logger
+from .browser_pool import BrowserPool, get_browser_pool
+from .politeness import get_scheduler, requests_per_minute_from_sleep
+from .parsing import make_soup
+from .routing import RequestFilter, prepare_page
+from .metrics import ShopMetrics
 nest_asyncio.apply()
 
 MAX_RETRIES = 5
@@ -23,6 +29,28 @@ REQUEST_TIMEOUT = 60000
 PAGE_LOAD_TIMEOUT = 60000
 
 
+class BehaviorProfile:
+    """How much scrolling and mouse movement to fake on a page, capped at budget seconds"""
+
+    def __init__(self, scrolls=(0, 0), scroll_pause=(0, 0), moves=(0, 0), move_pause=(0, 0),
+                 click_chance: float = 0.0, budget: float = 0.0):
+        self.scrolls = scrolls
+        self.scroll_pause = scroll_pause
+        self.moves = moves
+        self.move_pause = move_pause
+        self.click_chance = click_chance
+        self.budget = budget
+
+
+BEHAVIOR_PROFILES = {
+    "none": BehaviorProfile(),
+    "light": BehaviorProfile(scrolls=(1, 2), scroll_pause=(0.2, 0.5), moves=(1, 2),
+                             move_pause=(0.1, 0.3), budget=1.5),
+    "full": BehaviorProfile(scrolls=(3, 5), scroll_pause=(0.5, 1.5), moves=(2, 5),
+                            move_pause=(0.3, 0.8), click_chance=0.3, budget=10.0),
+}
+
+
 class SkipScrape(Exception):
     """Raised to indicate that scraping should be skipped (e.g. 404)."""
     pass
@@ -33,11 +61,41 @@ class ScrapingError(Exception):
     pass
 
 
+class RawPage:
+    """Unparsed page content plus response metadata, cheap to pickle"""
+
+    def __init__(self, url: str, status: int, headers: Dict[str, str], html: bytes):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.html = html
+
+
 class WebScraper:
-    def __init__(self):
+    def __init__(self, pool: BrowserPool, metrics: Optional[ShopMetrics] = None, request_filter: Optional[RequestFilter] = None):
         self.ua = UserAgent()
-        self.browser: Optional[Browser] = None
-        self.context: Optional[BrowserContext] = None
+        self.pool = pool
+        self.metrics = metrics
+        self.request_filter = request_filter
+
+    def _record_timing(self, wait_until: str, ready_sec: float, content_sec: float, behavior_sec: float) -> None:
+        if self.metrics is not None:
+            self.metrics.observe(f"latency.{wait_until}_ms", ready_sec * 1000)
+            self.metrics.incr("time.network_ms", round((ready_sec + content_sec) * 1000))
+            self.metrics.incr("time.behavior_ms", round(behavior_sec * 1000))
+
+    async def wait_until_ready(self, page: Page, selector: str, timeout: int = REQUEST_TIMEOUT) -> None:
+        """Wait until the document is parsed and selector is in the DOM.
+
+        Doesn't wait for subresources, load or network idle. Parsing has to
+        finish because an element is attached as soon as its start tag is
+        read, before its children arrive.
+        """
+        waits = [page.wait_for_load_state("domcontentloaded", timeout=timeout)]
+        if selector:
+            waits.append(page.wait_for_selector(
+                selector, state="attached", timeout=timeout))
+        await asyncio.gather(*waits)
 
     def get_headers(self, headers=None) -> Dict[str, str]:
         """Generate realistic browser headers"""
@@ -64,55 +122,48 @@ class WebScraper:
 
         return default_headers
 
-    async def setup_browser(self) -> None:
-        """Initialize browser and context"""
-        if self.browser is None:
-            playwright = await async_playwright().start()
-
-            browser_args = {
-                "headless": True,
-                "args": [
-                    "--disable-blink-features=AutomationControlled",
-                    "--disable-web-security",
-                    "--disable-features=VizDisplayCompositor",
-                    "--no-sandbox",
-                    "--disable-dev-shm-usage"
-                ]
-            }
-
-            self.browser = await playwright.chromium.launch(**browser_args)
-
-            context_options = {
-                "locale": "en-US",
-                "user_agent": self.ua.random,
-                "viewport": {"width": 1920, "height": 1080}
-            }
-
-            self.context = await self.browser.new_context(**context_options)
-
-    async def simulate_human_behavior(self, page: Page) -> None:
+    async def simulate_human_behavior(self, page: Page, behavior: str = "full") -> None:
+        profile = BEHAVIOR_PROFILES.get(behavior)
+        if profile is None:
+            logger.warning(f"Unknown behavior profile '{behavior}', using 'full'")
+            profile = BEHAVIOR_PROFILES["full"]
+        if not profile.budget:
+            return
+
+        deadline = time.monotonic() + profile.budget
+
+        async def pause(bounds) -> bool:
+            # Sleep within what is left of the budget; False once it is spent.
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            await asyncio.sleep(min(random.uniform(*bounds), remaining))
+            return True
+
         try:
             # Random scrolling
-            scroll_count = random.randint(3, 5)
+            scroll_count = random.randint(*profile.scrolls)
             for _ in range(scroll_count):
                 scroll_distance = random.randint(300, 700)
                 await page.mouse.wheel(0, scroll_distance)
-                await asyncio.sleep(random.uniform(0.5, 1.5))
+                if not await pause(profile.scroll_pause):
+                    return
 
             # Random mouse movements
-            move_count = random.randint(2, 5)
+            move_count = random.randint(*profile.moves)
             for _ in range(move_count):
                 x = random.randint(0, 1920)
                 y = random.randint(0, 1080)
                 await page.mouse.move(x, y)
-                await asyncio.sleep(random.uniform(0.3, 0.8))
+                if not await pause(profile.move_pause):
+                    return
 
             # Occasional random click (not on links)
-            if random.random() < 0.3:  # 30% chance
+            if random.random() < profile.click_chance:
                 safe_x = random.randint(100, 500)
                 safe_y = random.randint(100, 300)
                 await page.mouse.click(safe_x, safe_y)
-                await asyncio.sleep(random.uniform(0.5, 1))
+                await pause((0.5, 1))
 
         except Exception as e:
             logger.warning(f"Error during behavior simulation: {e}")
@@ -123,55 +174,64 @@ class WebScraper:
         selector: str,
         timeout: int = REQUEST_TIMEOUT,
         wait_until: str = "domcontentloaded",
-        simulate_behavior: bool = True,
+        behavior: str = "full",
         headers: Optional[Dict[str, str]] = None,
-    ) -> BeautifulSoup:
+        raw: bool = False,
+    ) -> Union[BeautifulSoup, RawPage]:
 
-        page = None
         try:
-            await self.setup_browser()
-
-            if not self.context:
-                raise ScrapingError("Failed to initialize browser context")
-
-            page = await self.context.new_page()
-
-            page.set_default_timeout(timeout)
-            page.set_default_navigation_timeout(PAGE_LOAD_TIMEOUT)
-
-            await page.set_extra_http_headers(self.get_headers(headers))
+            async with self.pool.page() as page:
+                page.set_default_timeout(timeout)
+                page.set_default_navigation_timeout(PAGE_LOAD_TIMEOUT)
+
+                await page.set_extra_http_headers(self.get_headers(headers))
+                router = await prepare_page(page, self.request_filter, self.metrics)
+
+                logger.info(f"Navigating to: {url}")
+                started = time.perf_counter()
+
+                valid_wait_until = {
+                    "load", "domcontentloaded", "networkidle", "commit", "ready"}
+                if wait_until not in valid_wait_until:
+                    logger.warning(
+                        f"Invalid wait_until '{wait_until}', defaulting to 'domcontentloaded'")
+                    wait_until = "domcontentloaded"
+
+                # "ready" only needs the response to start; readiness is
+                # decided by the DOM below, not by load events.
+                navigate_until = "commit" if wait_until == "ready" else wait_until
+                response = await page.goto(url, wait_until=navigate_until, timeout=PAGE_LOAD_TIMEOUT)
+
+                if not response:
+                    raise ScrapingError(f"No response received for {url}")
+
+                if response.status >= 400:
+                    raise SkipScrape(f"HTTP {response.status} error for {url}")
+
+                logger.info(f"Waiting for selector: {selector}")
+                if wait_until == "ready":
+                    await self.wait_until_ready(page, selector, timeout)
+                else:
+                    await page.wait_for_selector(selector, timeout=timeout)
+                loaded = time.perf_counter()
+
+                if behavior != "none":
+                    logger.info(f"Simulating human behavior ({behavior})...")
+                    await self.simulate_human_behavior(page, behavior)
+                simulated = time.perf_counter()
+
+                logger.info("Extracting page content...")
+                rendered_html = await page.content()
+                await router.record_transfer(url)
+                self._record_timing(wait_until, loaded - started,
+                                    time.perf_counter() - simulated, simulated - loaded)
 
-            logger.info(f"Navigating to: {url}")
-
-            valid_wait_until = {
-                "load", "domcontentloaded", "networkidle", "commit"}
-            if wait_until not in valid_wait_until:
-                logger.warning(
-                    f"Invalid wait_until '{wait_until}', defaulting to 'domcontentloaded'")
-                wait_until = "domcontentloaded"
-
-            response = await page.goto(url, wait_until=wait_until, timeout=PAGE_LOAD_TIMEOUT)
-
-            if not response:
-                raise ScrapingError(f"No response received for {url}")
-
-            if response.status >= 400:
-                raise SkipScrape(f"HTTP {response.status} error for {url}")
-
-            logger.info(f"Waiting for selector: {selector}")
-            await page.wait_for_selector(selector, timeout=timeout)
-
-            if simulate_behavior:
-                logger.info("Simulating human behavior...")
-                await self.simulate_human_behavior(page)
-
-            logger.info("Extracting page content...")
-            rendered_html = await page.content()
-
-            soup = BeautifulSoup(rendered_html, "html.parser")
             logger.success(f"Successfully extracted content from {url}")
 
-            return soup
+            if raw:
+                return RawPage(response.url, response.status, response.headers, rendered_html.encode("utf-8"))
+
+            return make_soup(rendered_html)
 
         except SkipScrape:
             # Don't retry for SkipScrape exceptions (404, etc.)
@@ -185,25 +245,20 @@ class WebScraper:
             logger.error(f"Error scraping {url}: {str(e)}")
             raise ScrapingError(f"Error scraping {url}: {str(e)}")
 
-        finally:
-            if page:
-                try:
-                    await page.close()
-                except Exception as e:
-                    logger.error(f"Error closing page: {e}")
-
     async def extract_scrape_content(
         self,
         url: str,
         selector: str,
         timeout: int = REQUEST_TIMEOUT,
         wait_until: str = "domcontentloaded",
-        simulate_behavior: bool = True,
+        behavior: str = "full",
         headers: Optional[Dict[str, str]] = None,
-    ) -> Optional[BeautifulSoup]:
+        raw: bool = False,
+    ) -> Optional[Union[BeautifulSoup, RawPage]]:
+        """Fetch url and return its soup, or a RawPage when raw is set"""
         try:
             return await retry_extract_scrape_content(
-                self, url, selector, timeout, wait_until, simulate_behavior, headers
+                self, url, selector, timeout, wait_until, behavior, headers, raw
             )
         except SkipScrape as e:
             logger.warning(f"Skipping scrape: {e}")
@@ -212,19 +267,6 @@ class WebScraper:
             logger.error(f"Failed to scrape after {MAX_RETRIES} attempts: {e}")
             return None
 
-    async def close(self) -> None:
-        """Clean up browser resources"""
-        try:
-            if self.context:
-                await self.context.close()
-            if self.browser:
-                await self.browser.close()
-        except Exception as e:
-            logger.error(f"Error closing browser: {e}")
-        finally:
-            self.browser = None
-            self.context = None
-
 
 @retry(
     wait=wait_exponential(
@@ -239,37 +281,36 @@ async def retry_extract_scrape_content(scraper, *args, **kwargs):
 
 
 class AsyncWebScraper:
-    def __init__(self):
-        self.scraper = WebScraper()
+    def __init__(self, pool: Optional[BrowserPool] = None, metrics: Optional[ShopMetrics] = None,
+                 request_filter: Optional[RequestFilter] = None):
+        self.pool = pool
+        self.metrics = metrics
+        self.request_filter = request_filter
 
     async def __aenter__(self):
-        return self.scraper
+        # Pages come from the shared, long-lived pool; nothing to tear down here.
+        return WebScraper(self.pool or get_browser_pool(), self.metrics, self.request_filter)
 
     async def __aexit__(self, *_):
-        await self.scraper.close()
+        pass
 
 
-async def scrape_url(url, selector, headers=None, wait_until="domcontentloaded", min_sec=2, max_sec=5) -> Optional[BeautifulSoup]:
-    async with AsyncWebScraper() as scraper:
-        result = await scraper.extract_scrape_content(url, selector, headers=headers, wait_until=wait_until)
-        delay = random.uniform(min_sec, max_sec)
-        if delay >= 60:
-            minutes = int(delay // 60)
-            seconds = delay % 60
-            logger.info(f"Sleep for {minutes} min {seconds:.2f} sec")
-        else:
-            logger.info(f"Sleep for {delay:.2f} sec")
+async def scrape_url(url, selector, headers=None, wait_until="domcontentloaded", min_sec=2, max_sec=5, raw=False, metrics=None, request_filter=None, behavior="full") -> Optional[Union[BeautifulSoup, RawPage]]:
+    # min_sec/max_sec only seed the host's budget when no ETL has declared one.
+    await get_scheduler().acquire(
+        url, requests_per_minute_from_sleep(min_sec, max_sec))
 
-        await asyncio.sleep(delay)
-        return result
+    async with AsyncWebScraper(metrics=metrics, request_filter=request_filter) as scraper:
+        return await scraper.extract_scrape_content(url, selector, wait_until=wait_until, behavior=behavior,
+                                                    headers=headers, raw=raw)
 
 
 async def scrape_urls(urls_and_selectors) -> list:
     async with AsyncWebScraper() as scraper:
         results = []
         for url, selector in urls_and_selectors:
+            await get_scheduler().acquire(url)
             result = await scraper.extract_scrape_content(url, selector)
             results.append(result)
 
-            await asyncio.sleep(random.uniform(2, 5))
         return results
@@ -1,30 +1,50 @@
-from ._asda import AsdaETL
-from ._bernpetfoods import BernPetFoodsETL
-from ._bitiba_etl import BitibaETL
-from ._burnspet import BurnsPetETL
-from ._directvet_etl import DirectVetETL
-from ._farmandpetplace import FarmAndPetPlaceETL
-from ._fishkeeper_etl import FishKeeperETL
-from ._harringtons import HarringtonsETL
-from ._healthypetstore import HealthyPetStoreETL
-from ._jollyes_etl import JollyesETL
-from ._lilyskitchen_etl import LilysKitchenETL
-from ._naturesmenu import NaturesMenuETL
-from ._ocado import OcadoETL
-from ._orijen import OrijenETL
-from ._petdrugsonline_etl import PetDrugsOnlineETL
-from ._petplanet_etl import PetPlanetETL
-from ._petshop import PetShopETL
-from ._petshoponline import PetShopOnlineETL
-from ._petsathome_etl import PetsAtHomeETL
-from ._petscorner import PetsCornerETL
-from ._petsupermarket_etl import PetSupermarketETL
-from ._purina_etl import PurinaETL
-from ._taylorpetfoods import TaylorPetFoodsETL
-from ._thenaturalpetstore import TheNaturalPetStoreETL
-from ._thepetexpress import ThePetExpressETL
-from ._therange import TheRangeETL
-from ._vetshop import VetShopETL
-from ._vetuk import VetUKETL
-from ._viovet_etl import ViovetETL
-from ._zooplus_etl import ZooplusETL
+import importlib
+
+# Shop classes are imported on first access so that importing one shop (or
+# the factory) doesn't load all of them.
+_SHOP_MODULES = {
+    "AsdaETL": "_asda",
+    "BernPetFoodsETL": "_bernpetfoods",
+    "BitibaETL": "_bitiba_etl",
+    "BurnsPetETL": "_burnspet",
+    "DirectVetETL": "_directvet_etl",
+    "FarmAndPetPlaceETL": "_farmandpetplace",
+    "FishKeeperETL": "_fishkeeper_etl",
+    "HarringtonsETL": "_harringtons",
+    "HealthyPetStoreETL": "_healthypetstore",
+    "JollyesETL": "_jollyes_etl",
+    "LilysKitchenETL": "_lilyskitchen_etl",
+    "NaturesMenuETL": "_naturesmenu",
+    "OcadoETL": "_ocado",
+    "OrijenETL": "_orijen",
+    "PetDrugsOnlineETL": "_petdrugsonline_etl",
+    "PetPlanetETL": "_petplanet_etl",
+    "PetShopETL": "_petshop",
+    "PetShopOnlineETL": "_petshoponline",
+    "PetsAtHomeETL": "_petsathome_etl",
+    "PetsCornerETL": "_petscorner",
+    "PetSupermarketETL": "_petsupermarket_etl",
+    "PurinaETL": "_purina_etl",
+    "TaylorPetFoodsETL": "_taylorpetfoods",
+    "TheNaturalPetStoreETL": "_thenaturalpetstore",
+    "ThePetExpressETL": "_thepetexpress",
+    "TheRangeETL": "_therange",
+    "VetShopETL": "_vetshop",
+    "VetUKETL": "_vetuk",
+    "ViovetETL": "_viovet_etl",
+    "ZooplusETL": "_zooplus_etl",
+}
+
+__all__ = list(_SHOP_MODULES)
+
+
+def __getattr__(name):
+    if name not in _SHOP_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f".{_SHOP_MODULES[name]}", __name__)
+    return getattr(module, name)
+
+
+def __dir__():
+    return __all__
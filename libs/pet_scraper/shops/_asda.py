@@ -15,32 +15,27 @@ class AsdaETL(PetProductsETL):
         self.SELECTOR_SCRAPE_PRODUCT_INFO = 'main.layout__main'
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 3
+        self.MAX_CONCURRENT_PRODUCT_INFO = 2
 
     def extract(self, category):
         category_link = f"{self.BASE_URL}{category}"
-        urls = []
 
         soup = asyncio.run(self.scrape(category_link, '.layout__main'))
 
+        def product_links(page_soup):
+            return [self.BASE_URL + product_list.find('a').get('href')
+                    for product_container in page_soup.find_all('ul', class_="co-product-list__main-cntr")
+                    for product_list in product_container.find_all('li')
+                    if product_list.find('a')]
+
+        n_pages = 1
         if soup.find('div', class_="co-pagination"):
             n_pages = int(
                 soup.find('div', class_="co-pagination__max-page").text)
 
-            for p in range(1, n_pages):
-                soup_page_pagination = asyncio.run(
-                    self.scrape(f"{category_link}?page={p}", '#main-content'))
-                for product_container in soup_page_pagination.find_all('ul', class_="co-product-list__main-cntr"):
-                    for product_list in product_container.find_all('li'):
-                        if product_list.find('a'):
-                            urls.append(self.BASE_URL +
-                                        product_list.find('a').get('href'))
-
-        else:
-            for product_container in soup.find_all('ul', class_="co-product-list__main-cntr"):
-                for product_list in product_container.find_all('li'):
-                    if product_list.find('a'):
-                        urls.append(self.BASE_URL +
-                                    product_list.find('a').get('href'))
+        urls = self.get_paginated_links(
+            lambda p: f"{category_link}?page={p}", n_pages, '#main-content',
+            product_links, first_page=soup)
 
         df = pd.DataFrame({"url": urls})
         df.insert(0, "shop", self.SHOP)
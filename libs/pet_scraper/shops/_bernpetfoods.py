@@ -1,12 +1,12 @@
 import re
 import json
-import requests
 import asyncio
 import math
 import pandas as pd
 
 from bs4 import BeautifulSoup
 from ..etl import PetProductsETL
+from ..feefo import FEEFO_SUMMARY_URL, FeefoRatings
 from loguru import logger
 
 
@@ -18,10 +18,14 @@ class BernPetFoodsETL(PetProductsETL):
         self.SELECTOR_SCRAPE_PRODUCT_INFO = '#primary'
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 3
+        self.MAX_CONCURRENT_PRODUCT_INFO = 2
+        self.FETCH_STRATEGY = "http"
+        # Ratings come from the reviews summary, as they always have.
+        self.FEEFO_RATINGS = FeefoRatings(
+            "bern-pet-foods", summary_url=FEEFO_SUMMARY_URL, origin="www.bernpetfoods.co.uk")
 
     def extract(self, category):
         category_link = f"{self.BASE_URL}{category}"
-        urls = []
 
         soup = asyncio.run(self.scrape(category_link, '#main-content'))
         if soup:
@@ -32,16 +36,13 @@ class BernPetFoodsETL(PetProductsETL):
 
             n_page = math.ceil(n_products / 18)
 
-            for i in range(1, n_page + 1):
-                page_url = f"{category_link}/page/{i}/"
-                product_info_soup = asyncio.run(
-                    self.scrape(page_url, '#main-content'))
+            def product_links(page_soup):
+                product_cards = page_soup.find_all("div", class_="ftc-product")
+                return [product_card.find("a")["href"] for product_card in product_cards]
 
-                product_cards = product_info_soup.find_all(
-                    "div", class_="ftc-product")
-                product_links = [product_card.find(
-                    "a")["href"] for product_card in product_cards]
-                urls.extend(product_links)
+            urls = self.get_paginated_links(
+                lambda i: f"{category_link}/page/{i}/", n_page, '#main-content',
+                product_links, first_page=soup)
 
             df = pd.DataFrame({"url": urls})
             df.insert(0, "shop", self.SHOP)
@@ -58,9 +59,7 @@ class BernPetFoodsETL(PetProductsETL):
             product_id = re.search(
                 r'postid-(\d+)', ' '.join(soup.body['class'])).group(0)
 
-            rating_wrapper = requests.get(
-                f"https://api.feefo.com/api/10/reviews/summary/product?since_period=ALL&parent_product_sku={product_id}&merchant_identifier=bern-pet-foods&origin=www.bernpetfoods.co.uk")
-            rating = int(rating_wrapper.json()['rating']['rating'])
+            rating = int(self.FEEFO_RATINGS.rating(product_id) or 0)
             product_rating = f'{rating}/5'
 
             variants = []
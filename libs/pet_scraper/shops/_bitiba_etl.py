@@ -1,12 +1,11 @@
 import re
 import json
 import math
-import time
-import random
 import pandas as pd
-import requests
 
 from ..etl import PetProductsETL
+from .. import http_client
+from ..politeness import get_scheduler
 from bs4 import BeautifulSoup
 from loguru import logger
 from tenacity import retry, wait_exponential, stop_after_attempt, retry_if_exception_type, before_sleep_log
@@ -25,8 +24,16 @@ class BitibaETL(PetProductsETL):
         self.SHOP = "Bitiba"
         self.BASE_URL = "https://www.bitiba.co.uk"
         self.SELECTOR_SCRAPE_PRODUCT_INFO = 'main#page-content'
-        self.MIN_SEC_SLEEP_PRODUCT_INFO = 310
-        self.MAX_SEC_SLEEP_PRODUCT_INFO = 350
+        self.MAX_CONCURRENT_PRODUCT_INFO = 1
+        # Bitiba challenges bots hardest; at this budget a failed HTTP try
+        # plus the browser fallback would cost two of very few requests.
+        self.FETCH_STRATEGY = "browser"
+        self.BEHAVIOR_PROFILE = "full"
+        # ~260 pages a day at this budget; refresh the catalogue fortnightly.
+        self.MAX_PAGES_PER_RUN = 250
+        self.FRESHNESS_HOURS = 24 * 14
+        self.REQUESTS_PER_MINUTE = 0.18
+        self.LISTING_REQUESTS_PER_MINUTE = 4.8
 
     @retry(
         wait=wait_exponential(
@@ -37,7 +44,8 @@ class BitibaETL(PetProductsETL):
         reraise=True,
     )
     def _fetch_json_with_retry(self, url):
-        response = requests.get(url)
+        get_scheduler().wait(url)
+        response = http_client.get(url)
         if response.status_code != 200:
             raise ScrapingError(
                 f"Failed to fetch: {url} | Status: {response.status_code}")
@@ -96,8 +104,6 @@ class BitibaETL(PetProductsETL):
         logger.info(
             f"Found {n_products} products across {n_pagination} pages.")
 
-        time.sleep(random.uniform(10, 15))
-
         for page in range(1, n_pagination + 1):
             page_url = build_url(page)
             logger.info(f"Accessing page {page}: {page_url}")
@@ -113,10 +119,9 @@ class BitibaETL(PetProductsETL):
                 ])
             except ScrapingError as e:
                 logger.warning(f"Skipping page {page}: {str(e)}")
+                self.metrics.incr("listing.page_failed")
                 continue
 
-            time.sleep(random.uniform(10, 15))
-
         df = pd.DataFrame({"url": urls})
         df.insert(0, "shop", self.SHOP)
         logger.info(f"Total extracted URLs: {len(df)}")
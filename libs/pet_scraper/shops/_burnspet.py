@@ -1,7 +1,7 @@
 import asyncio
-import requests
 import pandas as pd
 from ..etl import PetProductsETL
+from .. import http_client
 from bs4 import BeautifulSoup
 from loguru import logger
 
@@ -14,6 +14,9 @@ class BurnsPetETL(PetProductsETL):
         self.SELECTOR_SCRAPE_PRODUCT_INFO = 'div.productbig'
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 3
+        self.MAX_CONCURRENT_PRODUCT_INFO = 2
+        # transform() calls the Trustpilot widget API for ratings.
+        self.PARSE_IN_PROCESS = False
 
     def extract(self, category):
         category_link = f"{self.BASE_URL}{category}"
@@ -71,7 +74,7 @@ class BurnsPetETL(PetProductsETL):
 
                 sku_encoded = "%2C".join(sku.split(",")) if sku else ""
 
-                get_rating_details = requests.get(
+                get_rating_details = http_client.get(
                     f"https://widget.trustpilot.com/trustbox-data/{template_id}?businessUnitId={business_unit_id}&locale={locale}&sku={sku_encoded}")
                 if get_rating_details.status_code == 200:
                     if get_rating_details.json()["productReviewsSummary"]["starsAverage"] == 0.0:
@@ -16,13 +16,13 @@ class DirectVetETL(PetProductsETL):
         self.SELECTOR_SCRAPE_PRODUCT_INFO = '#center_column'
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 3
+        self.MAX_CONCURRENT_PRODUCT_INFO = 2
 
     def extract(self, category):
         current_url = f"{self.BASE_URL}/{category}"
-        urls = []
 
         soup = asyncio.run(self.scrape(
-            current_url, self.SELECTOR_SCRAPE_PRODUCT_INFO, wait_until="networkidle"))
+            current_url, self.SELECTOR_SCRAPE_PRODUCT_INFO, wait_until="ready"))
 
         # Check soup is valid and not a boolean
         if not soup or isinstance(soup, bool):
@@ -47,20 +47,13 @@ class DirectVetETL(PetProductsETL):
 
         pagination_page_num = math.ceil(product_count / 12)
 
-        for i in range(1, pagination_page_num + 1):
-            page_url = f"{current_url}?selected_filters=page-{i}"
+        def product_links(page_soup):
+            return [link.get('href') for link in page_soup.find_all('a', class_="product_img_link")
+                    if link.get('href')]
 
-            page_pagination_source = asyncio.run(
-                self.scrape(page_url, self.SELECTOR_SCRAPE_PRODUCT_INFO, wait_until="networkidle"))
-
-            if not page_pagination_source or isinstance(page_pagination_source, bool):
-                logger.warning(
-                    f"[WARN] Skipped page {i} due to failed scrape: {page_url}")
-                continue
-
-            for link in page_pagination_source.find_all('a', class_="product_img_link"):
-                if link.get('href'):
-                    urls.append(link.get('href'))
+        urls = self.get_paginated_links(
+            lambda i: f"{current_url}?selected_filters=page-{i}", pagination_page_num,
+            self.SELECTOR_SCRAPE_PRODUCT_INFO, product_links, first_page=soup, wait_until="ready")
 
         df = pd.DataFrame({"url": urls})
         df.insert(0, "shop", self.SHOP)
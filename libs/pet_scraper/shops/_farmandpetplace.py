@@ -1,9 +1,9 @@
 import math
 import asyncio
-import requests
 import pandas as pd
 
 from ..etl import PetProductsETL
+from ..feefo import FEEFO_SUMMARY_URL, FeefoRatings
 from bs4 import BeautifulSoup
 from loguru import logger
 
@@ -16,6 +16,10 @@ class FarmAndPetPlaceETL(PetProductsETL):
         self.SELECTOR_SCRAPE_PRODUCT_INFO = '.content-page'
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 3
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 3
+        self.MAX_CONCURRENT_PRODUCT_INFO = 1
+        # Ratings come from the reviews summary, as they always have.
+        self.FEEFO_RATINGS = FeefoRatings(
+            "farm-pet-place", summary_url=FEEFO_SUMMARY_URL, origin="www.farmandpetplace.co.uk")
 
     def extract(self, category):
         soup = asyncio.run(self.scrape(
@@ -55,6 +59,7 @@ class FarmAndPetPlaceETL(PetProductsETL):
                 if not soup_pagination or isinstance(soup_pagination, bool):
                     logger.warning(
                         f"[WARN] Skipped pagination page: {new_url}")
+                    self.metrics.incr("listing.page_failed")
                     continue
 
                 shop_area = soup_pagination.find(
@@ -84,9 +89,7 @@ class FarmAndPetPlaceETL(PetProductsETL):
             product_id = soup.find(
                 'div', class_="ruk_rating_snippet").get('data-sku')
 
-            rating_wrapper = requests.get(
-                f"https://api.feefo.com/api/10/reviews/summary/product?since_period=ALL&parent_product_sku={product_id}&merchant_identifier=farm-pet-place&origin=www.farmandpetplace.co.uk")
-            rating = float(rating_wrapper.json()['rating']['rating'])
+            rating = float(self.FEEFO_RATINGS.rating(product_id) or 0)
             product_rating = f'{rating}/5'
 
             variants = []
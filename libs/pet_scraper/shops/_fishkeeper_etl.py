@@ -1,9 +1,12 @@
 import asyncio
 import random
 import json
-import requests
 import pandas as pd
 from ..etl import PetProductsETL
+from ..feefo import FeefoRatings
+from ..politeness import get_scheduler
+from ..routing import prepare_page
+from ..parsing import make_soup
 from bs4 import BeautifulSoup
 from fake_useragent import UserAgent
 from playwright.async_api import async_playwright
@@ -16,8 +19,12 @@ class FishKeeperETL(PetProductsETL):
         self.SHOP = "FishKeeper"
         self.BASE_URL = "https://www.fishkeeper.co.uk"
         self.SELECTOR_SCRAPE_PRODUCT_INFO = '#maincontent'
+        self.READY_SELECTOR = "script[type*='application/ld+json']"
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 3
+        self.MAX_CONCURRENT_PRODUCT_INFO = 2
+        self.FETCH_STRATEGY = "http"
+        self.FEEFO_RATINGS = FeefoRatings("maidenhead-aquatics", "product_sku")
 
     async def product_list_scroll(self, url, selector):
         soup = None
@@ -44,7 +51,9 @@ class FishKeeperETL(PetProductsETL):
                     "Origin": "https://www.fishkeeper.co.uk",
                     "Referer": url,
                 })
+                router = await prepare_page(page, self.request_filter, self.metrics)
 
+                await get_scheduler().acquire(url)
                 await page.goto(url, wait_until="domcontentloaded")
                 await page.wait_for_selector(selector, timeout=30000)
 
@@ -63,13 +72,11 @@ class FishKeeperETL(PetProductsETL):
                         break
 
                 rendered_html = await page.content()
+                await router.record_transfer(url)
                 logger.info(
                     f"Successfully extracted data from {url}"
                 )
-                sleep_time = random.uniform(
-                    2, 5)
-                logger.info(f"Sleeping for {sleep_time} seconds...")
-                soup = BeautifulSoup(rendered_html, "html.parser")
+                soup = make_soup(rendered_html)
                 return soup.find('ol', class_="ais-InfiniteHits-list")
 
         except Exception as e:
@@ -97,16 +104,8 @@ class FishKeeperETL(PetProductsETL):
                 "script[type*='application/ld+json']").text)
             product_title = data["name"]
 
-            rating = 0
             sku = data["mpn"]
-            rating_wrapper = requests.get(
-                f"https://api.feefo.com/api/10/products/ratings?merchant_identifier=maidenhead-aquatics&review_count=true&product_sku={sku}")
-            if rating_wrapper.status_code == 200:
-                json_data = rating_wrapper.json()
-                products = json_data.get('products', [])
-
-                if products and 'rating' in products[0]:
-                    rating = float(products[0]['rating'])
+            rating = self.FEEFO_RATINGS.rating(sku) or 0
 
             description = data["description"]
             product_url = url.replace(self.BASE_URL, "")
@@ -15,23 +15,24 @@ class HarringtonsETL(PetProductsETL):
         self.SELECTOR_SCRAPE_PRODUCT_INFO = '#MainContent'
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 3
+        self.MAX_CONCURRENT_PRODUCT_INFO = 2
 
     def extract(self, category):
         category_link = f"{self.BASE_URL}{category}"
 
-        urls = []
         soup = asyncio.run(self.scrape(category_link, '#MainContent'))
 
         n_product = int(soup.find(
             'span', class_="boost-pfs-filter-total-product").find(string=True, recursive=False))
         pagination_length = math.ceil(n_product / 24)
 
-        for i in range(1, pagination_length + 1):
-            soup_pagination = asyncio.run(self.scrape(
-                f"{category_link}?page={i}", '#MainContent'))
-            for prod_list in soup_pagination.find_all('li', class_="list-product-card__item"):
-                urls.append(self.BASE_URL + prod_list.find('a',
-                            class_="card-product__heading-link").get('href').replace('#', ''))
+        def product_links(page_soup):
+            return [self.BASE_URL + prod_list.find('a', class_="card-product__heading-link").get('href').replace('#', '')
+                    for prod_list in page_soup.find_all('li', class_="list-product-card__item")]
+
+        urls = self.get_paginated_links(
+            lambda i: f"{category_link}?page={i}", pagination_length, '#MainContent',
+            product_links, first_page=soup)
 
         df = pd.DataFrame({"url": urls})
         df.insert(0, "shop", self.SHOP)
@@ -14,6 +14,8 @@ class HealthyPetStoreETL(PetProductsETL):
         self.SELECTOR_SCRAPE_PRODUCT_INFO = '#wrapper'
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 3
+        self.MAX_CONCURRENT_PRODUCT_INFO = 2
+        self.FETCH_STRATEGY = "http"
 
     def extract(self, category):
         url = self.BASE_URL + category
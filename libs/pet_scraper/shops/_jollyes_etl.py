@@ -14,8 +14,12 @@ class JollyesETL(PetProductsETL):
         self.SHOP = "Jollyes"
         self.BASE_URL = "https://www.jollyes.co.uk"
         self.SELECTOR_SCRAPE_PRODUCT_INFO = '#viewport'
+        self.READY_SELECTOR = "section[class*='lazy-review-section'] script[type*='application']"
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 4
+        self.MAX_CONCURRENT_PRODUCT_INFO = 2
+        self.FETCH_STRATEGY = "http"
+        self.MAX_CONCURRENT_CATEGORIES = 4
 
     def extract(self, category):
         category_link = f"{self.BASE_URL}/{category}.html"
@@ -31,10 +35,11 @@ class JollyesETL(PetProductsETL):
             category_product_urls = []
 
             category_soup = asyncio.run(self.scrape(
-                url, '.product-list', wait_until="networkidle"))
+                url, '.product-list', wait_until="ready"))
 
             if not category_soup:
                 logger.error(f"[ERROR] Failed to fetch or parse: {url}")
+                self.metrics.incr("listing.page_failed")
                 continue
 
             sorting_row = category_soup.find('div', class_="sorting-row")
@@ -60,6 +65,7 @@ class JollyesETL(PetProductsETL):
                 if not product_soup:
                     logger.error(
                         f"[ERROR] Failed to fetch or parse: {self.BASE_URL}{subcategory}?page={n}&perPage=100")
+                    self.metrics.incr("listing.page_failed")
                     continue
 
                 product_tiles = product_soup.select(
@@ -17,6 +17,7 @@ class NaturesMenuETL(PetProductsETL):
         self.SELECTOR_SCRAPE_PRODUCT_INFO = '#maincontent'
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 3
+        self.MAX_CONCURRENT_PRODUCT_INFO = 2
 
     import re
 
@@ -38,23 +39,15 @@ class NaturesMenuETL(PetProductsETL):
             return pd.DataFrame(columns=["shop", "url"])
 
         pagination_length = math.ceil(n_product / 12)
-        urls = []
-
-        for i in range(1, pagination_length + 1):
-            soup_pagination = asyncio.run(
-                self.scrape(f"{url}?page={i}", '#maincontent'))
-            try:
-                grid = soup_pagination.find('div', class_="product-grid")
-                products = grid.find_all('div', class_="product")
-            except AttributeError:
-                logger.error(
-                    f"[ERROR] Page structure invalid on page {i} of {category}")
-                continue
-
-            for prod in products:
-                href = prod.find('a').get('href')
-                if href:
-                    urls.append(self.BASE_URL + href)
+
+        def product_links(page_soup):
+            products = page_soup.find('div', class_="product-grid").find_all('div', class_="product")
+            return [self.BASE_URL + href for prod in products
+                    if (href := prod.find('a').get('href'))]
+
+        urls = self.get_paginated_links(
+            lambda i: f"{url}?page={i}", pagination_length, '#maincontent',
+            product_links, first_page=soup)
 
         df = pd.DataFrame({"url": urls})
         df.insert(0, "shop", self.SHOP)
@@ -1,9 +1,11 @@
 import asyncio
 import random
-import time
 import pandas as pd
 
 from ..etl import PetProductsETL
+from ..politeness import get_scheduler
+from ..routing import prepare_page
+from ..parsing import make_soup
 from bs4 import BeautifulSoup
 from fake_useragent import UserAgent
 from playwright.async_api import async_playwright
@@ -18,6 +20,7 @@ class OcadoETL(PetProductsETL):
         self.SELECTOR_SCRAPE_PRODUCT_INFO = '.main-content'
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 3
+        self.MAX_CONCURRENT_PRODUCT_INFO = 2
 
     async def product_list_scrolling(self, url, selector):
         soup = None
@@ -44,7 +47,9 @@ class OcadoETL(PetProductsETL):
                     "Origin": "https://www.ocado.com",
                     "Referer": url,
                 })
+                router = await prepare_page(page, self.request_filter, self.metrics)
 
+                await get_scheduler().acquire(url)
                 await page.goto(url, wait_until="domcontentloaded")
                 await page.wait_for_selector(selector, timeout=30000)
 
@@ -61,18 +66,16 @@ class OcadoETL(PetProductsETL):
                     # Scroll to the current position
                     await page.evaluate(f'window.scrollTo(0, {current_position})')
                     current_position += scroll_step
-                    time.sleep(scroll_delay)
+                    await asyncio.sleep(scroll_delay)
 
                 logger.info("Scraping complete. Extracting content...")
 
                 rendered_html = await page.content()
+                await router.record_transfer(url)
                 logger.info(
                     f"Successfully extracted data from {url}"
                 )
-                sleep_time = random.uniform(
-                    3, 5)
-                logger.info(f"Sleeping for {sleep_time} seconds...")
-                soup = BeautifulSoup(rendered_html, "html.parser")
+                soup = make_soup(rendered_html)
                 return soup.find('ul', class_="fops-regular")
 
         except Exception as e:
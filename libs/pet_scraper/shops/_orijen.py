@@ -1,9 +1,9 @@
 import asyncio
-import requests
 import json
 import pandas as pd
 
 from ..etl import PetProductsETL
+from ..feefo import FEEFO_SUMMARY_URL, FeefoRatings
 from bs4 import BeautifulSoup
 from loguru import logger
 
@@ -16,6 +16,10 @@ class OrijenETL(PetProductsETL):
         self.SELECTOR_SCRAPE_PRODUCT_INFO = 'form.variations_form'
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 3
+        self.MAX_CONCURRENT_PRODUCT_INFO = 2
+        # Ratings come from the reviews summary, as they always have.
+        self.FEEFO_RATINGS = FeefoRatings(
+            "orijen-pet-foods", summary_url=FEEFO_SUMMARY_URL, origin="www.orijenpetfoods.co.uk")
 
     def extract(self, category):
         url = self.BASE_URL+category
@@ -39,10 +43,9 @@ class OrijenETL(PetProductsETL):
             product_id = soup.find(
                 'input', attrs={'name': 'product_id'}).get('value')
 
-            rating_wrapper = requests.get(
-                f"https://api.feefo.com/api/10/reviews/summary/product?since_period=ALL&parent_product_sku={product_id}&merchant_identifier=orijen-pet-foods&origin=www.orijenpetfoods.co.uk")
-            rating = rating_wrapper.json()['rating']['rating']
-            product_rating = f'{rating}/5'
+            rating = self.FEEFO_RATINGS.rating(product_id)
+            if rating is not None:
+                product_rating = f'{rating}/5'
 
             variants = []
             prices = []
@@ -16,10 +16,10 @@ class PetDrugsOnlineETL(PetProductsETL):
         self.SELECTOR_SCRAPE_PRODUCT_INFO = '.page-columns'
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 3
+        self.MAX_CONCURRENT_PRODUCT_INFO = 2
 
     def extract(self, category):
         current_url = f"{self.BASE_URL}{category}"
-        urls = []
 
         soup = asyncio.run(self.scrape(
             current_url, self.SELECTOR_SCRAPE_PRODUCT_INFO))
@@ -40,33 +40,22 @@ class PetDrugsOnlineETL(PetProductsETL):
 
         times_to_click = math.ceil(all_product_number / initial_number_product)
 
-        for i in range(1, times_to_click + 1):
-            page_url = f"{current_url}?p={i}"
-            page_pagination_soup = asyncio.run(self.scrape(
-                page_url, self.SELECTOR_SCRAPE_PRODUCT_INFO))
-
-            if not page_pagination_soup:
+        def product_links(page_soup):
+            product_list_container = page_soup.find(
+                "ol", class_="products list items product-items")
+            if not product_list_container:
                 logger.warning(
-                    f"[WARNING] Skipping page {i} due to empty or invalid soup.")
-                continue
-
-            try:
-                product_list_container = page_pagination_soup.find(
-                    "ol", class_="products list items product-items")
-                if not product_list_container:
-                    logger.warning(
-                        f"[WARNING] Product list container not found on page {i}.")
-                    continue
-
-                product_list = product_list_container.find_all('li')
-                urls.extend([
-                    a_tag.get('href') for product in product_list
-                    if (a_tag := product.find('a')) and a_tag.get('href')
-                ])
-            except Exception as e:
-                logger.error(
-                    f"[ERROR] Failed to extract product list from {page_url}: {e}")
-                continue
+                    "[WARNING] Product list container not found on listing page.")
+                return []
+
+            return [
+                a_tag.get('href') for product in product_list_container.find_all('li')
+                if (a_tag := product.find('a')) and a_tag.get('href')
+            ]
+
+        urls = self.get_paginated_links(
+            lambda i: f"{current_url}?p={i}", times_to_click, self.SELECTOR_SCRAPE_PRODUCT_INFO,
+            product_links, first_page=soup)
 
         df = pd.DataFrame({"url": urls})
         df.insert(0, "shop", self.SHOP)
@@ -5,6 +5,10 @@ import asyncio
 import pandas as pd
 
 from ..etl import PetProductsETL
+from .. import http_client
+from ..politeness import get_scheduler
+from ..routing import prepare_page
+from ..parsing import make_soup
 from bs4 import BeautifulSoup
 from fake_useragent import UserAgent
 from playwright.async_api import async_playwright
@@ -22,6 +26,10 @@ class PetPlanetETL(PetProductsETL):
         self.SELECTOR_SCRAPE_PRODUCT_INFO = '.products-panel'
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 3
+        self.MAX_CONCURRENT_PRODUCT_INFO = 2
+        # transform() refetches the product page per variant; keep it on the
+        # event loop so those requests share the politeness budget.
+        self.PARSE_IN_PROCESS = False
 
     async def product_list_scrolling(self, url, selector, click_times):
         soup = None
@@ -48,7 +56,9 @@ class PetPlanetETL(PetProductsETL):
                     "Origin": "https://www.petplanet.co.uk",
                     "Referer": url,
                 })
+                router = await prepare_page(page, self.request_filter, self.metrics)
 
+                await get_scheduler().acquire(url)
                 await page.goto(url, wait_until="load")
                 await page.wait_for_selector(selector, timeout=30000)
 
@@ -82,13 +92,11 @@ class PetPlanetETL(PetProductsETL):
                 logger.info("Scraping complete. Extracting content...")
 
                 rendered_html = await page.content()
+                await router.record_transfer(url)
                 logger.info(
                     f"Successfully extracted data from {url}"
                 )
-                sleep_time = random.uniform(
-                    3, 5)
-                logger.info(f"Sleeping for {sleep_time} seconds...")
-                soup = BeautifulSoup(rendered_html, "html.parser")
+                soup = make_soup(rendered_html)
                 return soup.find_all('a', class_="product-name")
 
         except Exception as e:
@@ -152,8 +160,9 @@ class PetPlanetETL(PetProductsETL):
                     variant = product_variant.select_one(
                         "div[class*='h5']").text
 
-                    response_new = self.session.get(url, verify=False)
-                    soup_new = BeautifulSoup(response_new.content)
+                    get_scheduler().wait(url)
+                    response_new = http_client.get(url, verify=False)
+                    soup_new = make_soup(response_new.content)
 
                     price = soup_new.select_one("span[class*='fw-bold fs-4']")
                     if price is None:
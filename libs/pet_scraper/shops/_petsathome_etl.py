@@ -14,11 +14,12 @@ class PetsAtHomeETL(PetProductsETL):
         self.SHOP = "PetsAtHome"
         self.BASE_URL = "https://www.petsathome.com"
         self.SELECTOR_SCRAPE_PRODUCT_INFO = ''
+        self.READY_SELECTOR = "script#__NEXT_DATA__"
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 3
+        self.MAX_CONCURRENT_PRODUCT_INFO = 2
 
     def extract(self, category):
-        urls = []
         url = self.BASE_URL + f"/product/listing/{category}"
 
         soup = asyncio.run(self.scrape(
@@ -42,28 +43,17 @@ class PetsAtHomeETL(PetProductsETL):
                 f"[ERROR] Failed to extract product count from {url}: {e}")
             return pd.DataFrame(columns=["shop", "url"])
 
-        for n in range(1, n_pagination + 1):
-            pagination_url = url + f'?page={n}'
-            page_soup = asyncio.run(self.scrape(
-                pagination_url, '.search-results_grid__rmdgH', wait_until='load'))
-
-            if not page_soup:
-                logger.warning(
-                    f"[WARNING] Skipping page {n} due to empty or invalid soup.")
-                continue
-
-            try:
-                items = page_soup.find_all(
-                    'li', class_="results-grid_item__BuYWN")
-                urls.extend([
-                    self.BASE_URL + link.find('a').get('href')
-                    for link in items
-                    if link.find('a') and link.find('a').get('href')
-                ])
-            except Exception as e:
-                logger.error(
-                    f"[ERROR] Failed to extract URLs from {pagination_url}: {e}")
-                continue
+        def product_links(page_soup):
+            items = page_soup.find_all('li', class_="results-grid_item__BuYWN")
+            return [
+                self.BASE_URL + link.find('a').get('href')
+                for link in items
+                if link.find('a') and link.find('a').get('href')
+            ]
+
+        urls = self.get_paginated_links(
+            lambda n: url + f'?page={n}', n_pagination, '.search-results_grid__rmdgH',
+            product_links, first_page=soup, wait_until='load')
 
         df = pd.DataFrame({"url": urls})
         df.insert(0, "shop", self.SHOP)
@@ -1,8 +1,8 @@
 import math
 import asyncio
-import requests
 import pandas as pd
 from ..etl import PetProductsETL
+from ..feefo import FEEFO_IMPORTED_SUMMARY_URL, FeefoRatings
 from bs4 import BeautifulSoup
 from loguru import logger
 
@@ -15,10 +15,14 @@ class PetsCornerETL(PetProductsETL):
         self.SELECTOR_SCRAPE_PRODUCT_INFO = '#content'
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 3
+        self.MAX_CONCURRENT_PRODUCT_INFO = 2
+        # Ratings have always come from the importedreviews summary, and
+        # products/ratings isn't known to give the same figure.
+        self.FEEFO_RATINGS = FeefoRatings(
+            "pets-corner", summary_url=FEEFO_IMPORTED_SUMMARY_URL, origin="www.petscorner.co.uk")
 
     def extract(self, category):
         category_link = f"{self.BASE_URL}{category}"
-        urls = []
 
         soup = asyncio.run(self.scrape(category_link, '.ProductListing'))
         if not soup:
@@ -40,27 +44,14 @@ class PetsCornerETL(PetProductsETL):
                 f"[ERROR] Failed to parse product count from {category_link}: {e}")
             return pd.DataFrame(columns=["shop", "url"])
 
-        for p in range(1, n_pages + 1):
-            page_url = f'{category_link}?listing_page={p}'
-            soup_pagination = asyncio.run(
-                self.scrape(page_url, '.ProductListing'))
+        def product_links(page_soup):
+            return [self.BASE_URL + a_tag.get('href')
+                    for product in page_soup.find_all('div', class_="product-listing-column")
+                    if (a_tag := product.find('a')) and a_tag.get('href')]
 
-            if not soup_pagination:
-                logger.warning(
-                    f"[WARNING] Skipping page {p} — failed to scrape {page_url}")
-                continue
-
-            try:
-                product_divs = soup_pagination.find_all(
-                    'div', class_="product-listing-column")
-                for product in product_divs:
-                    a_tag = product.find('a')
-                    if a_tag and a_tag.get('href'):
-                        urls.append(self.BASE_URL + a_tag.get('href'))
-            except Exception as e:
-                logger.error(
-                    f"[ERROR] Failed to parse products on page {p} ({page_url}): {e}")
-                continue
+        urls = self.get_paginated_links(
+            lambda p: f'{category_link}?listing_page={p}', n_pages, '.ProductListing',
+            product_links, first_page=soup)
 
         df = pd.DataFrame({"url": urls})
         df.insert(0, "shop", self.SHOP)
@@ -79,18 +70,16 @@ class PetsCornerETL(PetProductsETL):
             product_rating = '0/5'
             product_id = soup.find_all(
                 'div', class_="notify-stock")[-1].get('data-productid')
-            sku = None
             sku_tag = soup.find('div', id="feefo-product-review-widgetId")
             if sku_tag.get('data-parent-product-sku'):
-                sku = f"parent_product_sku={sku_tag.get('data-parent-product-sku')}"
+                rating = self.FEEFO_RATINGS.rating(
+                    sku_tag.get('data-parent-product-sku'), 'parent_product_sku')
             else:
-                sku = f"product_sku={sku_tag.get('data-product-sku')}"
+                rating = self.FEEFO_RATINGS.rating(
+                    sku_tag.get('data-product-sku'), 'product_sku')
 
-            rating_wrapper = requests.get(
-                f"https://api.feefo.com/api/10/importedreviews/summary/product?since_period=ALL&{sku}&merchant_identifier=pets-corner&origin=www.petscorner.co.uk")
-            if rating_wrapper.status_code == 200:
-                product_rating = str(rating_wrapper.json()[
-                                     'rating']['rating']) + '/5'
+            if rating is not None:
+                product_rating = str(rating) + '/5'
 
             variants = []
             prices = []
@@ -1,10 +1,11 @@
 import math
 import asyncio
-import requests
 import pandas as pd
 
 
 from ..etl import PetProductsETL
+from .. import http_client
+from ..politeness import get_scheduler
 from bs4 import BeautifulSoup
 from loguru import logger
 
@@ -17,32 +18,29 @@ class PetShopETL(PetProductsETL):
         self.SELECTOR_SCRAPE_PRODUCT_INFO = ''
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 3
+        self.MAX_CONCURRENT_PRODUCT_INFO = 2
+        # transform() calls the shop's own API; keep it on the event loop so
+        # those requests share the politeness budget with the page fetches.
+        self.PARSE_IN_PROCESS = False
 
     def extract(self, category):
         category_link = f"{self.BASE_URL}{category}"
-        urls = []
         soup = asyncio.run(self.scrape(
             category_link, 'div.facets-facet-browse-items'))
 
         n_products = int(soup.select_one(
             "h1[class='facets-facet-browse-title']")["data-quantity"])
         n_products_per_page = 50
-        n_pages = math.ceil(n_products / n_products_per_page) + 1
-
-        for p in range(1, n_pages):
-            if p == 1:
-                category_link_page = category_link
-            else:
-                category_link_page = f"{category_link}?page={p}"
-
-            pagination_soup = asyncio.run(self.scrape(
-                category_link_page, 'div.facets-facet-browse-items'))
-            if pagination_soup:
-                product_links_a = pagination_soup.select(
-                    "a[class='facets-item-cell-grid-link-image']")
-                product_links = [self.BASE_URL + plink["href"]
-                                 for plink in product_links_a]
-                urls.extend(product_links)
+        n_pages = math.ceil(n_products / n_products_per_page)
+
+        def product_links(page_soup):
+            product_links_a = page_soup.select(
+                "a[class='facets-item-cell-grid-link-image']")
+            return [self.BASE_URL + plink["href"] for plink in product_links_a]
+
+        urls = self.get_paginated_links(
+            lambda p: f"{category_link}?page={p}", n_pages,
+            'div.facets-facet-browse-items', product_links, first_page=soup)
 
         df = pd.DataFrame({"url": urls})
         df.insert(0, "shop", self.SHOP)
@@ -93,8 +91,9 @@ class PetShopETL(PetProductsETL):
             image_urls.append(', '.join([img.find('img').get(
                 'src') for img in soup.find('ul', class_="bxslider").find_all('li')]))
 
-            get_price_details = requests.get(
-                f"https://www.petshop.co.uk/api/cacheable/items?c=3934951&country=GB&currency=GBP&fieldset=details&include=facets&language=en&n=2&pricelevel=5&url={product_url.replace('/', '')}&use_pcv=T")
+            price_url = f"https://www.petshop.co.uk/api/cacheable/items?c=3934951&country=GB&currency=GBP&fieldset=details&include=facets&language=en&n=2&pricelevel=5&url={product_url.replace('/', '')}&use_pcv=T"
+            get_scheduler().wait(price_url)
+            get_price_details = http_client.get(price_url)
             if get_price_details.status_code == 200:
                 product_info = get_price_details.json()['items'][0]
                 if product_info.get('pricelevel2') is not None:
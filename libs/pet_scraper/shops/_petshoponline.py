@@ -1,8 +1,9 @@
 import math
 import asyncio
-import requests
 import pandas as pd
 from ..etl import PetProductsETL
+from .. import http_client
+from ..politeness import get_scheduler
 from bs4 import BeautifulSoup
 from fake_useragent import UserAgent
 from loguru import logger
@@ -16,6 +17,11 @@ class PetShopOnlineETL(PetProductsETL):
         self.SELECTOR_SCRAPE_PRODUCT_INFO = '.product-block-list'
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 3
+        self.MAX_CONCURRENT_PRODUCT_INFO = 2
+        self.FETCH_STRATEGY = "http"
+        # transform() calls the shop's own API; keep it on the event loop so
+        # those requests share the politeness budget with the page fetches.
+        self.PARSE_IN_PROCESS = False
 
     def extract(self, category):
         url = self.BASE_URL+category
@@ -23,13 +29,14 @@ class PetShopOnlineETL(PetProductsETL):
         n_product = int(soup.find(
             'p', class_="collection__products-count").get_text().replace(' products', '').replace(' product', ''))
         pagination_length = math.ceil(n_product / 24)
-        urls = []
 
-        for i in range(1, pagination_length + 1):
-            soup_pagination = asyncio.run(self.scrape(
-                f"{url}?page={i}", '.product-list--collection'))
-            for prod_list in soup_pagination.find('div', class_="product-list--collection").find_all('div', class_="product-item--vertical"):
-                urls.append(self.BASE_URL + prod_list.find('a').get('href'))
+        def product_links(page_soup):
+            return [self.BASE_URL + prod_list.find('a').get('href')
+                    for prod_list in page_soup.find('div', class_="product-list--collection").find_all('div', class_="product-item--vertical")]
+
+        urls = self.get_paginated_links(
+            lambda i: f"{url}?page={i}", pagination_length, '.product-list--collection',
+            product_links, first_page=soup)
 
         df = pd.DataFrame({"url": urls})
         df.insert(0, "shop", self.SHOP)
@@ -59,7 +66,8 @@ class PetShopOnlineETL(PetProductsETL):
                 'Accept': 'application/json'
             }
 
-            product_info = requests.get(url, headers=headers)
+            get_scheduler().wait(url)
+            product_info = http_client.get(url, headers=headers)
 
             for variant_info in product_info.json()['product']["variants"]:
                 variants.append(variant_info.get('title'))
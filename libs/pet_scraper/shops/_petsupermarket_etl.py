@@ -16,6 +16,7 @@ class PetSupermarketETL(PetProductsETL):
         self.SELECTOR_SCRAPE_PRODUCT_INFO = '.product-details'
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 3
+        self.MAX_CONCURRENT_PRODUCT_INFO = 2
 
     def extract(self, category):
         current_url = f"{self.BASE_URL}{category}"
@@ -14,6 +14,7 @@ class PurinaETL(PetProductsETL):
         self.SELECTOR_SCRAPE_PRODUCT_INFO = '#main-layout'
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 3
+        self.MAX_CONCURRENT_PRODUCT_INFO = 2
 
     def extract(self, category):
         current_url = f"{self.BASE_URL}{category}"
@@ -26,15 +27,14 @@ class PurinaETL(PetProductsETL):
                 'div', class_="view-header").find('div', class_="header").get_text().split(' of ')[1])
             n_pagination = math.ceil(n_product / 12)
 
-            urls = [self.BASE_URL + product.get('href') for product in soup.find_all(
-                'a', class_="product-tile_image")]
-            for n in range(1, n_pagination + 1):
-                pagination_url = current_url + f'?page={n}'
-                pagination_soup = asyncio.run(
-                    self.scrape(pagination_url, '.main-view-content'))
+            def product_links(page_soup):
+                return [self.BASE_URL + product.get('href') for product in page_soup.find_all(
+                    'a', class_="product-tile_image")]
 
-                urls.extend([self.BASE_URL + product.get('href') for product in pagination_soup.find_all(
-                    'a', class_="product-tile_image")])
+            # Page 1 is the bare category URL; ?page=N is the (N+1)th page.
+            urls = self.get_paginated_links(
+                lambda n: current_url + f'?page={n - 1}', n_pagination + 1,
+                '.main-view-content', product_links, first_page=soup)
 
         df = pd.DataFrame({"url": urls})
         df.insert(0, "shop", self.SHOP)
@@ -15,6 +15,7 @@ class TaylorPetFoodsETL(PetProductsETL):
         self.SELECTOR_SCRAPE_PRODUCT_INFO = '.main-content'
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 3
+        self.MAX_CONCURRENT_PRODUCT_INFO = 2
 
     def extract(self, category):
         url = f"{self.BASE_URL}{category}"
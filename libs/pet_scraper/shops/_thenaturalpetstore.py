@@ -1,9 +1,10 @@
 import math
 import asyncio
-import requests
 import pandas as pd
 
 from ..etl import PetProductsETL
+from .. import http_client
+from ..politeness import get_scheduler
 from bs4 import BeautifulSoup
 from fake_useragent import UserAgent
 from loguru import logger
@@ -17,6 +18,10 @@ class TheNaturalPetStoreETL(PetProductsETL):
         self.SELECTOR_SCRAPE_PRODUCT_INFO = '#main'
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 3
+        self.MAX_CONCURRENT_PRODUCT_INFO = 2
+        # transform() calls the shop's own API; keep it on the event loop so
+        # those requests share the politeness budget with the page fetches.
+        self.PARSE_IN_PROCESS = False
 
     def extract(self, category):
         url = self.BASE_URL+category
@@ -25,14 +30,14 @@ class TheNaturalPetStoreETL(PetProductsETL):
             n_product = int(soup.find(
                 'p', class_="collection__products-count-total").get_text().replace(' products', ''))
             pagination_length = math.ceil(n_product / 24)
-            urls = []
 
-            for i in range(1, pagination_length + 1):
-                soup_pagination = asyncio.run(self.scrape(
-                    f"{url}?page={i}", '.layout__section'))
-                for prod_list in soup_pagination.find_all('div', class_="product-item--vertical"):
-                    urls.append(self.BASE_URL +
-                                prod_list.find('a').get('href'))
+            def product_links(page_soup):
+                return [self.BASE_URL + prod_list.find('a').get('href')
+                        for prod_list in page_soup.find_all('div', class_="product-item--vertical")]
+
+            urls = self.get_paginated_links(
+                lambda i: f"{url}?page={i}", pagination_length, '.layout__section',
+                product_links, first_page=soup)
 
             df = pd.DataFrame({"url": urls})
             df.insert(0, "shop", self.SHOP)
@@ -72,7 +77,8 @@ class TheNaturalPetStoreETL(PetProductsETL):
                 'Accept': 'application/json'
             }
 
-            product_info = requests.get(url, headers=headers)
+            get_scheduler().wait(url)
+            product_info = http_client.get(url, headers=headers)
 
             for variant_info in product_info.json()['product']["variants"]:
                 variants.append(variant_info.get('title'))
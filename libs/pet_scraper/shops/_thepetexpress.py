@@ -14,6 +14,7 @@ class ThePetExpressETL(PetProductsETL):
         self.SELECTOR_SCRAPE_PRODUCT_INFO = '.product_page'
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 3
+        self.MAX_CONCURRENT_PRODUCT_INFO = 2
 
     def extract(self, category):
         url = self.BASE_URL + category
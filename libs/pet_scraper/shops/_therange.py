@@ -4,6 +4,8 @@ import random
 import pandas as pd
 
 from ..etl import PetProductsETL
+from ..politeness import get_scheduler
+from ..routing import prepare_page
 from bs4 import BeautifulSoup
 from loguru import logger
 from fake_useragent import UserAgent
@@ -18,6 +20,10 @@ class TheRangeETL(PetProductsETL):
         self.SELECTOR_SCRAPE_PRODUCT_INFO = '#variant_container'
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 5
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 10
+        self.MAX_CONCURRENT_PRODUCT_INFO = 1
+        self.LISTING_REQUESTS_PER_MINUTE = 8
+        # transform() fetches variant data through the browser.
+        self.PARSE_IN_PROCESS = False
 
     async def get_data_variant(self, url):
         browser = None
@@ -58,12 +64,11 @@ class TheRangeETL(PetProductsETL):
                     "Origin": "https://www.therange.co.uk",
                     "Referer": url,
                 })
+                router = await prepare_page(page, self.request_filter, self.metrics)
 
+                await get_scheduler().acquire(url)
                 await page.goto(url, wait_until="networkidle")
-
-                sleep_time = random.uniform(2, 5)
-                logger.info(f"Sleeping for {sleep_time:.2f} seconds...")
-                await asyncio.sleep(sleep_time)
+                await router.record_transfer(url)
 
                 return data
 
@@ -15,9 +15,10 @@ class VetUKETL(PetProductsETL):
         self.SELECTOR_SCRAPE_PRODUCT_INFO = '#maincontent'
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 3
+        self.MAX_CONCURRENT_PRODUCT_INFO = 2
+        self.LISTING_REQUESTS_PER_MINUTE = 40
 
     def extract(self, category):
-        urls = []
         soup = asyncio.run(self.scrape(
             category, '#productListing', min_sec=1, max_sec=2))
 
@@ -25,39 +26,25 @@ class VetUKETL(PetProductsETL):
 
         if heading:
             match = re.search(r'\((\d+)\s+results\)', heading.get_text())
-
             n_product = int(match.group(1))
-            n_pagination = math.ceil(n_product / 20)
-
-            for n in range(1, n_pagination + 1):
-                pagination_url = f"{category}&page={n}"
-                pagination_soup = asyncio.run(self.scrape(
-                    pagination_url, '.product-list-table', min_sec=1, max_sec=2))
-
-                urls.extend([
-                    link.find('a').get('href')
-                    for link in pagination_soup.find_all('h3', class_="itemTitle")
-                    if link.find('a') and link.find('a').get('href')
-                ])
         else:
             n_product = int(soup.find('div', id="pagination").find_all(
                 'strong')[2].get_text(strip=True))
 
-            n_pagination = math.ceil(n_product / 20)
+        n_pagination = math.ceil(n_product / 20)
 
-            for n in range(1, n_pagination + 1):
-                pagination_url = f"{category}&page={n}"
-                pagination_soup = asyncio.run(self.scrape(
-                    pagination_url, '.product-list-table', min_sec=1, max_sec=2))
+        def product_links(page_soup):
+            return [
+                link.find('a').get('href')
+                for link in page_soup.find_all('h3', class_="itemTitle")
+                if link.find('a') and link.find('a').get('href')
+            ]
 
-                urls.extend([
-                    link.find('a').get('href')
-                    for link in pagination_soup.find_all('h3', class_="itemTitle")
-                    if link.find('a') and link.find('a').get('href')
-                ])
+        urls = self.get_paginated_links(
+            lambda n: f"{category}&page={n}", n_pagination, '.product-list-table',
+            product_links, first_page=soup, min_sec=1, max_sec=2)
 
         df = pd.DataFrame({"url": urls})
-        df = df.drop_duplicates(subset=['url'], keep="first")
         df.insert(0, "shop", self.SHOP)
         return df
 
@@ -14,10 +14,10 @@ class ViovetETL(PetProductsETL):
         self.SELECTOR_SCRAPE_PRODUCT_INFO = '#family_page'
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 3
+        self.MAX_CONCURRENT_PRODUCT_INFO = 2
 
     def extract(self, category):
         current_url = f"{self.BASE_URL}{category}?sort_by=_score+desc&items_per_page=124"
-        urls = []
 
         additional_headers = {
             "Accept-Language": "en-US,en;q=0.9,zh-TW;q=0.8,zh-CN;q=0.7,zh;q=0.6"
@@ -32,17 +32,14 @@ class ViovetETL(PetProductsETL):
         except (AttributeError, IndexError, ValueError):
             pagination_length = 1
 
-        for n in range(1, pagination_length + 1):
-            page_url = f"{self.BASE_URL}{category}?page={n}&sort_by=_score+desc&items_per_page=124"
-            page_pagination_source = asyncio.run(
-                self.scrape(page_url, '#full_search_form',  wait_until='load'))
-            urls.extend([
-                self.BASE_URL + a['href']
-                for a in page_pagination_source.find_all('a', itemprop="url")
-            ])
+        def product_links(page_soup):
+            return [self.BASE_URL + a['href'] for a in page_soup.find_all('a', itemprop="url")]
+
+        urls = self.get_paginated_links(
+            lambda n: f"{self.BASE_URL}{category}?page={n}&sort_by=_score+desc&items_per_page=124",
+            pagination_length, '#full_search_form', product_links, first_page=soup, wait_until='load')
 
         df = pd.DataFrame({"url": urls})
-        df = df.drop_duplicates(subset=['url'], keep="first")
         df.insert(0, "shop", self.SHOP)
         return df
 
@@ -1,12 +1,11 @@
 import asyncio
-import requests
 import re
-import random
 import json
-import time
 import pandas as pd
 
 from ..etl import PetProductsETL
+from .. import http_client
+from ..politeness import get_scheduler
 from bs4 import BeautifulSoup
 from loguru import logger
 from fake_useragent import UserAgent
@@ -18,22 +17,28 @@ class ZooplusETL(PetProductsETL):
         self.SHOP = "Zooplus"
         self.BASE_URL = "https://www.zooplus.co.uk"
         self.SELECTOR_SCRAPE_PRODUCT_INFO = ''
+        # transform() reads the JSON-LD block; an HTTP page without it is
+        # a bot challenge and goes to the browser.
+        self.READY_SELECTOR = "script[type*='application/ld+json']"
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 3
+        self.MAX_CONCURRENT_PRODUCT_INFO = 2
+        self.FETCH_STRATEGY = "http"
+        self.MAX_CONCURRENT_CATEGORIES = 4
+        self.BEHAVIOR_PROFILE = "full"
+        self.LISTING_REQUESTS_PER_MINUTE = 30
 
     def get_product_links(self, url, headers):
         try:
+            get_scheduler().wait(url)
+
             # Parse request response
-            response = requests.get(url=url, headers=headers)
+            response = http_client.get(url=url, headers=headers)
             response.raise_for_status()
 
             logger.info(
                 f"Successfully extracted data from {url} {response.status_code}"
             )
-            sleep_time = random.uniform(
-                self.MIN_SEC_SLEEP_PRODUCT_INFO, self.MAX_SEC_SLEEP_PRODUCT_INFO)
-            time.sleep(sleep_time)
-            logger.info(f"Sleeping for {sleep_time} seconds...")
             return response
 
         except Exception as e:
@@ -42,14 +47,12 @@ class ZooplusETL(PetProductsETL):
     def extract(self, category):
         headers = {
             "Accept": 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-            'Accept-Encoding': 'gzip, deflate, br, zstd',
             'Accept-Language': 'en-US,en;q=0.9',
             'Cache-Control': 'max-age=0',
             "User-Agent": UserAgent().random,
             'Referer': 'https://www.zooplus.co.uk',
             'Priority': "u=0, i",
             "Upgrade-Insecure-Requests": "1",
-            "Connection": "keep-alive",
             "Sec-Ch-Ua": "\"Not(A:Brand\";v=\"99\", \"Opera GX\";v=\"118\", \"Chromium\";v=\"133\"",
             "Sec-Ch-Ua-Mobile": "?0",
             "Sec-Ch-Ua-Platform": "\"Windows\"",
@@ -0,0 +1,2 @@
+ALTER TABLE urls
+    ADD COLUMN content_fingerprint char(64);
\ No newline at end of file
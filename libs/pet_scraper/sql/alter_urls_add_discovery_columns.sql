@@ -0,0 +1,5 @@
+ALTER TABLE urls
+    ADD COLUMN last_seen_date datetime
+    ,ADD COLUMN is_active tinyint(1) NOT NULL DEFAULT 1;
+
+UPDATE urls SET last_seen_date=inserted_date WHERE last_seen_date IS NULL;
\ No newline at end of file
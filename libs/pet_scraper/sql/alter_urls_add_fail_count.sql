@@ -0,0 +1,2 @@
+ALTER TABLE urls
+    ADD COLUMN fail_count int NOT NULL DEFAULT 0;
\ No newline at end of file
@@ -0,0 +1,2 @@
+ALTER TABLE urls
+    ADD COLUMN missed_runs int NOT NULL DEFAULT 0;
\ No newline at end of file
@@ -54,6 +54,11 @@ CREATE TABLE urls (
     ,url varchar(255) CHARACTER SET utf8mb4
     ,scrape_status varchar(25) CHARACTER SET utf8mb4 DEFAULT 'NOT STARTED'
     ,updated_date datetime
+    ,last_seen_date datetime
+    ,is_active tinyint(1) NOT NULL DEFAULT 1
+    ,missed_runs int NOT NULL DEFAULT 0
+    ,fail_count int NOT NULL DEFAULT 0
+    ,content_fingerprint char(64)
 );
 
 DROP TABLE IF EXISTS stg_pet_products;
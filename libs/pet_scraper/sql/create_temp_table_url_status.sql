@@ -0,0 +1,6 @@
+CREATE TEMPORARY TABLE IF NOT EXISTS {table_name} (
+    id INT PRIMARY KEY,
+    scrape_status VARCHAR(25),
+    updated_date DATETIME,
+    content_fingerprint CHAR(64)
+);
\ No newline at end of file
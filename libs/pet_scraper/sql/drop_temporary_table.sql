@@ -0,0 +1 @@
+DROP TEMPORARY TABLE IF EXISTS {table_name};
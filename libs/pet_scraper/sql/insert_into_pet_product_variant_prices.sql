@@ -12,10 +12,20 @@ SELECT DISTINCT
     a.discounted_price,
     a.discount_percentage
 FROM {table_name} a
-LEFT JOIN pet_product_variants b 
+JOIN pet_product_variants b 
     ON b.url = a.url 
    AND IFNULL(b.variant, '') = IFNULL(a.variant, '')
-LEFT JOIN pet_product_variant_prices c 
-    ON c.product_variant_id = b.id 
-   AND c.shop_id = b.shop_id
-WHERE c.id IS NULL;
+LEFT JOIN (
+    -- Latest recorded price of each variant
+    SELECT p.product_variant_id, p.price, p.discounted_price, p.discount_percentage
+    FROM pet_product_variant_prices p
+    JOIN (
+        SELECT product_variant_id, MAX(id) AS id
+        FROM pet_product_variant_prices
+        GROUP BY product_variant_id
+    ) latest ON latest.id = p.id
+) c ON c.product_variant_id = b.id
+WHERE c.product_variant_id IS NULL
+   OR NOT (c.price <=> a.price
+           AND c.discounted_price <=> a.discounted_price
+           AND c.discount_percentage <=> a.discount_percentage);
@@ -0,0 +1,7 @@
+INSERT INTO {table_name} (
+    id
+    ,scrape_status
+    ,updated_date
+    ,content_fingerprint
+)
+VALUES (:pkey, :status, :timestamp, :fingerprint);
\ No newline at end of file
@@ -2,11 +2,13 @@ INSERT INTO urls (
     shop
     ,url
     ,updated_date
+    ,last_seen_date
 )
 SELECT DISTINCT
 	a.shop
     ,a.url
     ,a.updated_date
+    ,:seen
 FROM {table_name} a 
 LEFT JOIN urls b ON b.url=a.url
 WHERE b.id IS NULL;
\ No newline at end of file
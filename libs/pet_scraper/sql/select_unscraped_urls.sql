@@ -1 +0,0 @@
-SELECT DISTINCT id, url FROM urls WHERE scrape_status<>'DONE' AND shop='{shop}';
\ No newline at end of file
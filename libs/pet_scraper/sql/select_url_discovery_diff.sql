@@ -0,0 +1,19 @@
+SELECT
+    (SELECT COUNT(DISTINCT a.url)
+     FROM {table_name} a
+     LEFT JOIN urls b ON b.url=a.url
+     WHERE b.id IS NULL) AS n_new
+    ,(SELECT COUNT(DISTINCT a.url)
+     FROM {table_name} a
+     JOIN urls b ON b.url=a.url AND b.shop=:shop) AS n_present
+    ,(SELECT COUNT(*)
+     FROM urls b
+     WHERE b.shop=:shop
+       AND b.is_active=1
+       AND NOT EXISTS (SELECT 1 FROM {table_name} a WHERE a.url=b.url)) AS n_missing
+    ,(SELECT COUNT(*)
+     FROM urls b
+     WHERE b.shop=:shop
+       AND b.is_active=1
+       AND b.missed_runs + 1 >= :vanish_after_runs
+       AND NOT EXISTS (SELECT 1 FROM {table_name} a WHERE a.url=b.url)) AS n_vanished;
\ No newline at end of file
@@ -0,0 +1,30 @@
+SELECT id, url, content_fingerprint, priority, due_at
+FROM (
+    SELECT
+        id
+        ,url
+        ,content_fingerprint
+        ,CASE scrape_status
+            WHEN 'FAILED' THEN 1
+            WHEN 'DONE' THEN 2
+            ELSE 0
+        END AS priority
+        ,COALESCE(updated_date, inserted_date, CAST('1970-01-01' AS DATETIME)) AS due_at
+    FROM urls
+    WHERE shop=:shop
+      AND is_active=1
+      AND (
+            scrape_status NOT IN ('DONE', 'FAILED')
+         OR (scrape_status='FAILED'
+             AND (updated_date IS NULL
+                  OR updated_date <= DATE_SUB(:now, INTERVAL LEAST(
+                        :backoff_minutes * POW(2, GREATEST(fail_count, 1) - 1),
+                        :freshness_minutes) MINUTE)))
+         OR (scrape_status='DONE'
+             AND (updated_date IS NULL
+                  OR updated_date <= DATE_SUB(:now, INTERVAL :freshness_minutes MINUTE)))
+      )
+) t
+WHERE (priority, due_at, id) > (:last_priority, :last_due_at, :last_id)
+ORDER BY priority, due_at, id
+LIMIT :limit;
\ No newline at end of file
@@ -1,4 +1,5 @@
 UPDATE urls 
-SET scrape_status='{status}'
-    ,updated_date='{timestamp}'
-WHERE id={pkey}
\ No newline at end of file
+SET fail_count=CASE WHEN :status='FAILED' THEN fail_count + 1 ELSE 0 END
+    ,scrape_status=:status
+    ,updated_date=:timestamp
+WHERE id=:pkey
\ No newline at end of file
@@ -0,0 +1,6 @@
+UPDATE urls a
+JOIN {table_name} b ON b.id = a.id
+SET a.fail_count = CASE WHEN b.scrape_status = 'FAILED' THEN a.fail_count + 1 ELSE 0 END
+    ,a.scrape_status = b.scrape_status
+    ,a.updated_date = b.updated_date
+    ,a.content_fingerprint = COALESCE(b.content_fingerprint, a.content_fingerprint);
\ No newline at end of file
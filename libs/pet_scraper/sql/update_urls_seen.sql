@@ -0,0 +1,6 @@
+UPDATE urls b
+JOIN (SELECT DISTINCT url FROM {table_name}) a ON a.url=b.url
+SET b.last_seen_date=:seen
+    ,b.is_active=1
+    ,b.missed_runs=0
+WHERE b.shop=:shop;
\ No newline at end of file
@@ -0,0 +1,7 @@
+UPDATE urls b
+-- is_active first: MySQL assigns left to right, so this sees the old count.
+SET b.is_active = CASE WHEN b.missed_runs + 1 >= :vanish_after_runs THEN 0 ELSE 1 END
+    ,b.missed_runs = b.missed_runs + 1
+WHERE b.shop=:shop
+  AND b.is_active=1
+  AND NOT EXISTS (SELECT 1 FROM {table_name} a WHERE a.url=b.url);
\ No newline at end of file
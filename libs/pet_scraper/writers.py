@@ -0,0 +1,129 @@
+import os
+import time
+import pandas as pd
+
+from typing import Callable, List, Optional
+from loguru import logger
+from .connection import Connection
+
+URL_STATUS_BATCH_SIZE = int(os.getenv("URL_STATUS_BATCH_SIZE", "200"))
+URL_STATUS_FLUSH_SECONDS = float(os.getenv("URL_STATUS_FLUSH_SECONDS", "30"))
+BULK_LOAD_BATCH_SIZE = int(os.getenv("BULK_LOAD_BATCH_SIZE", "2000"))
+BULK_LOAD_CHUNK_SIZE = int(os.getenv("BULK_LOAD_CHUNK_SIZE", "500"))
+
+
+class UrlStatusWriter:
+    """Buffers urls status updates and flushes them every N rows or T seconds"""
+
+    def __init__(
+        self,
+        connection: Connection,
+        batch_size: int = URL_STATUS_BATCH_SIZE,
+        flush_seconds: float = URL_STATUS_FLUSH_SECONDS,
+        before_flush: Optional[Callable[[], None]] = None,
+    ):
+        self.connection = connection
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        # Lets callers persist scraped rows before their DONE status lands.
+        self.before_flush = before_flush
+        self._rows = []
+        self._last_flush = time.monotonic()
+
+    def add(self, pkey: int, status: str, timestamp: str, fingerprint: Optional[str] = None) -> None:
+        """Queue a status update; a None fingerprint keeps the URL's stored one"""
+        self._rows.append(
+            {"pkey": int(pkey), "status": status, "timestamp": timestamp, "fingerprint": fingerprint})
+
+        if len(self._rows) >= self.batch_size or time.monotonic() - self._last_flush >= self.flush_seconds:
+            self.flush()
+
+    def flush(self) -> None:
+        self._last_flush = time.monotonic()
+        if not self._rows:
+            return
+
+        if self.before_flush:
+            self.before_flush()
+
+        rows, self._rows = self._rows, []
+        try:
+            self.connection.update_url_scrape_statuses(rows)
+        except Exception:
+            # Keep the batch so a later flush can retry it.
+            self._rows = rows + self._rows
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *_):
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error(
+                f"Failed to flush {len(self._rows)} URL status update(s): {e}")
+            if exc_type is None:
+                raise
+
+
+class BulkLoader:
+    """Buffers DataFrames bound for one table and appends them in large batches"""
+
+    def __init__(
+        self,
+        connection: Connection,
+        table_name: str,
+        batch_size: int = BULK_LOAD_BATCH_SIZE,
+        chunksize: int = BULK_LOAD_CHUNK_SIZE,
+    ):
+        self.connection = connection
+        self.table_name = table_name
+        self.batch_size = batch_size
+        self.chunksize = chunksize
+        self._frames: List[pd.DataFrame] = []
+        self._n_rows = 0
+
+    def add(self, data: pd.DataFrame) -> None:
+        if data.empty:
+            return
+
+        self._frames.append(data)
+        self._n_rows += data.shape[0]
+
+        if self._n_rows >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._frames:
+            return
+
+        data = pd.concat(self._frames, ignore_index=True)
+        start = time.perf_counter()
+        try:
+            data.to_sql(self.table_name, self.connection.engine, if_exists="append",
+                        index=False, method="multi", chunksize=self.chunksize)
+        except Exception as e:
+            logger.error(f"Error bulk loading into {self.table_name}: {e}")
+            raise
+
+        elapsed = time.perf_counter() - start
+        self._frames = []
+        self._n_rows = 0
+
+        n = data.shape[0]
+        rate = n / elapsed if elapsed > 0 else float("inf")
+        logger.success(
+            f"Successfully loaded {n} records to the {self.table_name} in {elapsed:.2f} sec ({rate:.0f} rows/sec).")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *_):
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error(
+                f"Failed to flush {self._n_rows} buffered record(s) to {self.table_name}: {e}")
+            if exc_type is None:
+                raise